@@ -7,6 +7,11 @@ from typing import Dict, List
 import yaml
 
 
+# Prefer the libyaml-backed loader when PyYAML was built with it (shared
+# with the scenario runner so both YAML readers behave the same)
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 @dataclass
 class OverloadThresholds:
     """Thresholds for determining OVERLOADED state."""
@@ -76,7 +81,7 @@ def load_config(config_path: str = "config.yaml") -> Config:
     # Load YAML file
     try:
         with open(path, 'r') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=SafeLoader)
     except yaml.YAMLError as e:
         raise ConfigurationError(
             f"Failed to parse YAML configuration: {config_path}\n"
@@ -21,6 +21,10 @@ from typing import Any
 from dataclasses import dataclass
 
 
+# Message carried by every ExecutionError raised from this module
+DISABLED_MESSAGE = "Automation disabled in current system version"
+
+
 class ExecutionError(Exception):
     """
     Exception raised when execution is attempted in a system where it is disabled.
@@ -65,4 +69,4 @@ def execute_action(action: Any, authority: Any) -> None:
         ...     print(f"Expected error: {e}")
         Expected error: Automation disabled in current system version
     """
-    raise ExecutionError("Automation disabled in current system version")
+    raise ExecutionError(DISABLED_MESSAGE)
@@ -9,12 +9,12 @@ Requirements: 11.1, 11.2, 11.3, 11.4, 11.5
 import argparse
 import sys
 from pathlib import Path
-from typing import List, NoReturn
+from typing import Callable, Dict, List, NoReturn, Optional, Tuple
 
 from pl_dss.config import Config, ConfigurationError, load_config
 from pl_dss.evaluator import StateInputs, ValidationError, evaluate_state
 from pl_dss.rules import get_active_rules
-from pl_dss.authority import derive_authority
+from pl_dss.authority import GlobalAuthority, derive_authority
 from pl_dss.scenario_runner import (
     Scenario,
     ScenarioResult,
@@ -292,6 +292,61 @@ def cmd_scenario_validate(args: argparse.Namespace, config: Config) -> int:
         return 1
 
 
+def evaluate_inputs(args: argparse.Namespace, config: Config) -> GlobalAuthority:
+    """Evaluate state from 'evaluate' arguments and derive authority.
+    
+    Args:
+        args: Parsed command-line arguments with deadlines, domains, and energy
+        config: System configuration
+        
+    Returns:
+        GlobalAuthority derived from Decision Core output
+        
+    Raises:
+        ValidationError: If inputs are invalid
+    """
+    # Create state inputs
+    inputs = StateInputs(
+        fixed_deadlines_14d=args.deadlines,
+        active_high_load_domains=args.domains,
+        energy_scores_last_3_days=args.energy
+    )
+    
+    # Evaluate state
+    state_result = evaluate_state(inputs, config)
+    
+    # Get active rules
+    rule_result = get_active_rules(state_result.state, config)
+    
+    # Derive authority
+    return derive_authority(state_result, rule_result)
+
+
+def format_evaluate_output(authority: GlobalAuthority) -> str:
+    """Format 'evaluate' output (scenario output format without scenario name).
+    
+    Args:
+        authority: GlobalAuthority from evaluate_inputs()
+        
+    Returns:
+        Formatted plain text output
+    """
+    lines = []
+    lines.append("STATE: " + authority.state)
+    lines.append("AUTHORITY:")
+    lines.append(f"- planning: {authority.planning}")
+    lines.append(f"- execution: {authority.execution}")
+    lines.append(f"MODE: {authority.mode}")
+    lines.append("ACTIVE RULES:")
+    if authority.active_rules:
+        for rule in authority.active_rules:
+            lines.append(f"- {rule}")
+    else:
+        lines.append("(none)")
+    
+    return "\n".join(lines)
+
+
 def cmd_evaluate(args: argparse.Namespace, config: Config) -> int:
     """Execute 'evaluate' command.
     
@@ -307,38 +362,8 @@ def cmd_evaluate(args: argparse.Namespace, config: Config) -> int:
     Requirements: 11.3, 11.4, 11.5
     """
     try:
-        # Create state inputs
-        inputs = StateInputs(
-            fixed_deadlines_14d=args.deadlines,
-            active_high_load_domains=args.domains,
-            energy_scores_last_3_days=args.energy
-        )
-        
-        # Evaluate state
-        state_result = evaluate_state(inputs, config)
-        
-        # Get active rules
-        rule_result = get_active_rules(state_result.state, config)
-        
-        # Derive authority
-        authority = derive_authority(state_result, rule_result)
-        
-        # Format output (similar to scenario output but without scenario name)
-        lines = []
-        lines.append("STATE: " + authority.state)
-        lines.append("AUTHORITY:")
-        lines.append(f"- planning: {authority.planning}")
-        lines.append(f"- execution: {authority.execution}")
-        lines.append(f"MODE: {authority.mode}")
-        lines.append("ACTIVE RULES:")
-        if authority.active_rules:
-            for rule in authority.active_rules:
-                lines.append(f"- {rule}")
-        else:
-            lines.append("(none)")
-        
-        output = "\n".join(lines)
-        print(output)
+        authority = evaluate_inputs(args, config)
+        print(format_evaluate_output(authority))
         
         return 0
         
@@ -416,61 +441,75 @@ def cmd_validate_v03(args: argparse.Namespace, config: Config) -> int:
         return 1
 
 
-def main() -> NoReturn:
-    """Main entry point for PLO CLI.
+# Command handlers keyed by (command, scenario_command)
+COMMAND_TABLE: Dict[Tuple[str, Optional[str]], Callable[[argparse.Namespace, Config], int]] = {
+    ('scenario', 'run'): cmd_scenario_run,
+    ('scenario', 'run-all'): cmd_scenario_run_all,
+    ('scenario', 'validate'): cmd_scenario_validate,
+    ('evaluate', None): cmd_evaluate,
+    ('validate-v03', None): cmd_validate_v03,
+}
+
+
+def run_cli(argv: Optional[List[str]] = None) -> int:
+    """Run the PLO CLI and return its exit code.
     
     Parses arguments, loads configuration, and dispatches to appropriate command handler.
     
+    Args:
+        argv: Command-line arguments without the program name (default: sys.argv[1:])
+        
+    Returns:
+        Exit code (0 for success, 1 for error, 130 if cancelled by user)
+        
     Requirements: 11.1, 11.2, 11.3, 11.4, 11.5
     """
     parser = create_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # Check if command was provided
     if args.command is None:
         parser.print_help()
-        sys.exit(1)
+        return 1
     
     # Check if scenario subcommand was provided
     if args.command == 'scenario' and args.scenario_command is None:
         parser.parse_args(['scenario', '--help'])
-        sys.exit(1)
+        return 1
     
     try:
         # Load configuration
         config = load_config(args.config)
         
         # Dispatch to appropriate command handler
-        if args.command == 'scenario':
-            if args.scenario_command == 'run':
-                exit_code = cmd_scenario_run(args, config)
-            elif args.scenario_command == 'run-all':
-                exit_code = cmd_scenario_run_all(args, config)
-            elif args.scenario_command == 'validate':
-                exit_code = cmd_scenario_validate(args, config)
-            else:
-                parser.print_help()
-                exit_code = 1
-        elif args.command == 'evaluate':
-            exit_code = cmd_evaluate(args, config)
-        elif args.command == 'validate-v03':
-            exit_code = cmd_validate_v03(args, config)
-        else:
+        handler = COMMAND_TABLE.get((args.command, getattr(args, 'scenario_command', None)))
+        if handler is None:
             parser.print_help()
-            exit_code = 1
+            return 1
         
-        sys.exit(exit_code)
+        return handler(args, config)
         
     except ConfigurationError as e:
         print(f"ERROR: Configuration error", file=sys.stderr)
         print(f"Details: {str(e)}", file=sys.stderr)
-        sys.exit(1)
+        return 1
     except KeyboardInterrupt:
         print("\n\nOperation cancelled by user.", file=sys.stderr)
-        sys.exit(130)
+        return 130
     except Exception as e:
         print(f"ERROR: Unexpected error\nDetails: {str(e)}", file=sys.stderr)
-        sys.exit(1)
+        return 1
+
+
+def main(argv: Optional[List[str]] = None) -> NoReturn:
+    """Main entry point for PLO CLI.
+    
+    Exits the process with the exit code from run_cli().
+    
+    Args:
+        argv: Command-line arguments without the program name (default: sys.argv[1:])
+    """
+    sys.exit(run_cli(argv))
 
 
 if __name__ == "__main__":
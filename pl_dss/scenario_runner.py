@@ -9,14 +9,14 @@ Requirements: 5.1, 5.2, 5.3, 5.4, 5.5, 5.6, 5.7, 5.8, 5.9, 6.1, 6.2, 6.3, 6.4, 6
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 import json
 import yaml
 
 from pl_dss.evaluator import StateInputs, StateResult, evaluate_state
 from pl_dss.rules import RuleResult, get_active_rules
 from pl_dss.authority import GlobalAuthority, derive_authority
-from pl_dss.config import Config
+from pl_dss.config import Config, SafeLoader
 from pl_dss.planning import Task, Constraint, PlanRequest, PlanResult, propose_plan, format_advisory_output
 
 
@@ -78,13 +78,16 @@ class ScenarioError(Exception):
 
 
 
-def load_scenarios(filepath: str) -> List[Scenario]:
-    """Load scenarios from YAML or JSON file.
+def load_scenarios(source: Union[str, Path, Dict[str, Any]]) -> List[Scenario]:
+    """Load scenarios from YAML or JSON file, or from already-parsed data.
     
     Supports both YAML and JSON formats. File format is determined by extension.
+    A dictionary is taken to be the parsed file content and is validated the
+    same way, without touching the filesystem.
     
     Args:
-        filepath: Path to scenario file (.yaml, .yml, or .json)
+        source: Path to scenario file (.yaml, .yml, or .json), or a dictionary
+            with the same structure as the file content
         
     Returns:
         List of Scenario objects loaded from file
@@ -94,6 +97,10 @@ def load_scenarios(filepath: str) -> List[Scenario]:
         
     Requirements: 5.1
     """
+    if isinstance(source, dict):
+        return _scenarios_from_data(source, "<mapping>")
+    
+    filepath = str(source)
     path = Path(filepath)
     
     # Check if file exists
@@ -107,7 +114,7 @@ def load_scenarios(filepath: str) -> List[Scenario]:
     try:
         with open(path, 'r') as f:
             if path.suffix in ['.yaml', '.yml']:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=SafeLoader)
             elif path.suffix == '.json':
                 data = json.load(f)
             else:
@@ -133,6 +140,22 @@ def load_scenarios(filepath: str) -> List[Scenario]:
             f"Details: {str(e)}"
         )
     
+    return _scenarios_from_data(data, filepath)
+
+
+def _scenarios_from_data(data: Any, filepath: str) -> List[Scenario]:
+    """Validate parsed scenario file content and build Scenario objects.
+    
+    Args:
+        data: Parsed file content
+        filepath: Source name used in error messages
+        
+    Returns:
+        List of Scenario objects
+        
+    Raises:
+        ScenarioError: If the structure is invalid or contains no scenarios
+    """
     # Validate structure
     if data is None:
         raise ScenarioError(
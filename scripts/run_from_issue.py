@@ -331,7 +331,7 @@ Violating these rules breaks the safety guarantees of the system.
 
 import re
 import sys
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 from pl_dss.authority import derive_authority
 from pl_dss.config import Config, ConfigurationError, load_config
@@ -348,6 +348,19 @@ from pl_dss.recovery import check_recovery
 from pl_dss.rules import get_active_rules
 
 
+# Words separating a task name from its deadline (matched case-insensitively)
+_TASK_SEPARATORS = frozenset({'due', 'by', '-'})
+
+# One "### " header line (GitHub Issue forms put one before each field label)
+# followed by its content: every following line that is not itself a header.
+# A header on the final line has no content line after it and is not matched.
+_SECTION_RE = re.compile(
+    r'^###[^\S\n]([^\n]*)\n'
+    r'((?:(?!###[^\S\n])[^\n]*\n)*(?:(?!###[^\S\n])[^\n]+\Z)?)',
+    re.MULTILINE
+)
+
+
 class IssueParsingError(Exception):
     """Raised when Issue body parsing fails."""
     pass
@@ -392,24 +405,11 @@ def parse_issue_body(issue_body: str) -> Tuple[StateInputs, Optional[str]]:
             "Action: Please fill in all required fields in the Issue template"
         )
     
-    # Split by ### headers to get sections
-    sections = re.split(r'###\s+', issue_body)
-    
-    # Build a dictionary of section_title -> content
-    parsed_sections = {}
-    for section in sections:
-        if not section.strip():
-            continue
-        
-        # Split on first newline to separate title from content
-        lines = section.split('\n', 1)
-        if len(lines) < 2:
-            continue
-        
-        title = lines[0].strip().lower()
-        content = lines[1].strip()
-        
-        parsed_sections[title] = content
+    # Build a dictionary of section_title -> content in one regex pass
+    parsed_sections = {
+        match.group(1).strip().lower(): match.group(2).strip()
+        for match in _SECTION_RE.finditer(issue_body)
+    }
     
     # Extract deadlines field
     deadlines = None
@@ -577,10 +577,11 @@ def parse_tasks_text(tasks_text: str) -> list[Task]:
         # Remove type if present
         if type_match:
             name_part = name_part.replace(type_match.group(0), '')
-        # Remove common separators
-        name_part = re.sub(r'\b(due|by|-)\b', '', name_part, flags=re.IGNORECASE)
-        # Clean up whitespace
-        name = name_part.strip()
+        # Remove common separators and clean up whitespace
+        name = ' '.join(
+            word for word in name_part.split()
+            if word.lower() not in _TASK_SEPARATORS
+        )
         
         if name:
             tasks.append(Task(name=name, deadline=deadline, type=task_type))
@@ -588,7 +589,7 @@ def parse_tasks_text(tasks_text: str) -> list[Task]:
     return tasks
 
 
-def main():
+def main(argv: Optional[List[str]] = None) -> int:
     """Main entry point for glue script.
     
     Flow:
@@ -606,19 +607,29 @@ def main():
     - Parsing errors: Print clear error message
     - Validation errors: Print validation error from Decision Core
     - System errors: Print error with traceback
+    
+    Args:
+        argv: Command-line arguments excluding the program name
+            (defaults to sys.argv[1:])
+        
+    Returns:
+        Exit code: 0 on success, 1 on error, 130 if interrupted
     """
+    if argv is None:
+        argv = sys.argv[1:]
+    
     try:
         # Check for Issue body argument
-        if len(sys.argv) < 2:
+        if not argv:
             print(
                 "ERROR: Missing Issue body argument\n\n"
                 "Usage: python scripts/run_from_issue.py \"<issue_body>\"\n\n"
                 "This script is designed to be called by GitHub Actions.",
                 file=sys.stderr
             )
-            sys.exit(1)
+            return 1
         
-        issue_body = sys.argv[1]
+        issue_body = argv[0]
         
         # Parse Issue body
         try:
@@ -627,7 +638,7 @@ def main():
             # Format error for GitHub comment
             formatted_error = format_for_github(str(e))
             print(formatted_error, file=sys.stderr)
-            sys.exit(1)
+            return 1
         
         # Load configuration
         try:
@@ -640,7 +651,7 @@ def main():
             )
             formatted_error = format_for_github(error_msg)
             print(formatted_error, file=sys.stderr)
-            sys.exit(1)
+            return 1
         
         # Run Decision Core pipeline
         try:
@@ -651,7 +662,7 @@ def main():
             # Format validation error for GitHub comment
             formatted_error = format_for_github(str(e))
             print(formatted_error, file=sys.stderr)
-            sys.exit(1)
+            return 1
         
         # Derive Global Authority
         authority = derive_authority(state_result, rule_result)
@@ -690,12 +701,13 @@ def main():
         
         # Print to stdout for GitHub Actions to capture
         print(formatted_output)
+        return 0
         
     except KeyboardInterrupt:
         error_msg = "\n\nOperation cancelled by user."
         formatted_error = format_for_github(error_msg)
         print(formatted_error, file=sys.stderr)
-        sys.exit(130)
+        return 130
     except Exception as e:
         import traceback
         error_msg = (
@@ -706,8 +718,8 @@ def main():
         )
         formatted_error = format_for_github(error_msg)
         print(formatted_error, file=sys.stderr)
-        sys.exit(1)
+        return 1
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,224 @@
+"""Shared pytest configuration for the PL-DSS test suite."""
+
+import ast
+import hashlib
+import os
+import pickle
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Set
+
+import pytest
+from hypothesis import settings
+
+from pl_dss.config import load_config
+from pl_dss.scenario_runner import load_scenarios
+
+
+# Hypothesis profiles. "fast" keeps local runs short; "ci" is the same size
+# but derandomized and without the example database, so CI runs are
+# reproducible and do no per-example disk I/O; "thorough" samples more widely
+# and is intended for scheduled runs. "ci" is the default when CI is set.
+# Select with: HYP_PROFILE=thorough pytest tests/
+settings.register_profile("fast", max_examples=20, deadline=None)
+settings.register_profile("ci", max_examples=20, deadline=None, derandomize=True, database=None)
+settings.register_profile("thorough", max_examples=200)
+settings.load_profile(os.environ.get("HYP_PROFILE", "ci" if os.environ.get("CI") else "fast"))
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+GLUE_SCRIPT = REPO_ROOT / "scripts" / "run_from_issue.py"
+CONFIG_YAML = REPO_ROOT / "config.yaml"
+README = REPO_ROOT / "README.md"
+TEST_SCENARIOS = REPO_ROOT / "scenarios" / "test_scenarios.yaml"
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--ast-cache",
+        action="store_true",
+        default=False,
+        help="Reuse parsed glue script ASTs stored in .pytest_cache across runs",
+    )
+
+
+def _cached_ast(source: bytes, cache_dir: Path) -> ast.Module:
+    """Parse source, reusing a pickled AST from an earlier run if present.
+    
+    Entries are keyed by the source bytes and the Python version, since AST
+    node classes differ between versions. Writing a new entry deletes the
+    others, so edits to the source do not accumulate stale pickles.
+    
+    Args:
+        source: Raw Python source
+        cache_dir: Directory holding pickled ASTs
+        
+    Returns:
+        Parsed module AST
+    """
+    key = hashlib.blake2b(source, digest_size=16)
+    key.update(sys.version.encode("utf-8"))
+    cache_file = cache_dir / f"{key.hexdigest()}.pickle"
+    
+    if cache_file.exists():
+        try:
+            return pickle.loads(cache_file.read_bytes())
+        except (pickle.UnpicklingError, EOFError, AttributeError, OSError):
+            pass  # Corrupt or stale entry; parse and overwrite below
+    
+    tree = ast.parse(source)
+    for stale in cache_dir.glob("*.pickle"):
+        if stale != cache_file:
+            stale.unlink(missing_ok=True)
+    cache_file.write_bytes(pickle.dumps(tree))
+    return tree
+
+
+@pytest.fixture(scope="session")
+def real_config():
+    """Load the project's config.yaml once per session."""
+    return load_config(str(CONFIG_YAML))
+
+
+@pytest.fixture(scope="session")
+def real_scenarios():
+    """Load scenarios/test_scenarios.yaml once per session.
+    
+    Tests only read the returned Scenario objects; none may modify them.
+    """
+    return load_scenarios(str(TEST_SCENARIOS))
+
+
+@pytest.fixture(scope="session")
+def readme_content():
+    """Load README.md content once per session."""
+    return README.read_text(encoding="utf-8")
+
+
+@pytest.fixture(scope="session")
+def yaml_file(tmp_path_factory):
+    """Factory that writes YAML content to a session temp file.
+    
+    Files are named by a hash of their content, so identical content is
+    written once and the same path is returned to every caller.
+    """
+    base = tmp_path_factory.mktemp("yamls")
+    cache = {}
+    
+    def _make(content: str) -> str:
+        digest = hashlib.blake2b(content.encode("utf-8"), digest_size=8).hexdigest()
+        path = cache.get(digest)
+        if path is None:
+            path = base / f"{digest}.yaml"
+            path.write_text(content, encoding="utf-8")
+            cache[digest] = path
+        return str(path)
+    
+    return _make
+
+
+@pytest.fixture(scope="session")
+def glue_script_bytes():
+    """Load raw glue script (scripts/run_from_issue.py) bytes once per session.
+    
+    Skips every test that depends on the glue script when it is absent; the
+    skip is raised once and reused for the rest of the session.
+    """
+    if not GLUE_SCRIPT.exists():
+        pytest.skip(f"{GLUE_SCRIPT} missing; skipping glue script checks")
+    return GLUE_SCRIPT.read_bytes()
+
+
+@pytest.fixture(scope="session")
+def glue_script_content(glue_script_bytes):
+    """Glue script source decoded once per session."""
+    return glue_script_bytes.decode("utf-8")
+
+
+@pytest.fixture(scope="session")
+def glue_script_ast(glue_script_bytes, pytestconfig):
+    """Parse glue script into AST once per session.
+    
+    With --ast-cache the AST is also reused across runs while the script is
+    unchanged. CI runs without the flag and always parses fresh, as does any
+    run with the cache plugin disabled (-p no:cacheprovider).
+    """
+    cache = getattr(pytestconfig, "cache", None)
+    if pytestconfig.getoption("ast_cache") and cache is not None:
+        return _cached_ast(glue_script_bytes, cache.mkdir("ast"))
+    return ast.parse(glue_script_bytes)
+
+
+@pytest.fixture(scope="session")
+def glue_code_without_docstrings(glue_script_bytes):
+    """Glue script source with comments and docstrings removed.
+    
+    Comments are dropped by ast.parse; docstrings are removed from the tree
+    before unparsing. Note that ast.unparse normalizes string literals to
+    single quotes.
+    """
+    # Parse a private tree to mutate; re-parsing is cheaper than deepcopy
+    # of the shared glue_script_ast
+    tree = ast.parse(glue_script_bytes)
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.Module, ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            if (node.body and isinstance(node.body[0], ast.Expr)
+                    and isinstance(node.body[0].value, ast.Constant)
+                    and isinstance(node.body[0].value.value, str)):
+                node.body.pop(0)
+    return ast.unparse(tree)
+
+
+@pytest.fixture(scope="session")
+def glue_defined_functions(glue_script_ast):
+    """Names of all functions defined anywhere in the glue script."""
+    return {
+        node.name for node in ast.walk(glue_script_ast)
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+    }
+
+
+@dataclass
+class ScriptSymbols:
+    """Names imported and called by a script.
+    
+    Attributes:
+        imports: Module name -> names imported via "from module import ..."
+        calls: Names of called functions (bare names and attribute names)
+    """
+    imports: Dict[str, Set[str]]
+    calls: Set[str]
+
+
+class _SymbolCollector(ast.NodeVisitor):
+    """Collect "from module import ..." names and called function names."""
+    
+    def __init__(self):
+        self.imports: Dict[str, Set[str]] = {}
+        self.calls: Set[str] = set()
+    
+    def visit_ImportFrom(self, node):
+        # Import nodes hold only aliases, so there is nothing below to visit
+        if node.module:
+            self.imports.setdefault(node.module, set()).update(alias.name for alias in node.names)
+    
+    def visit_Import(self, node):
+        pass
+    
+    def visit_Constant(self, node):
+        pass
+    
+    def visit_Call(self, node):
+        if isinstance(node.func, ast.Name):
+            self.calls.add(node.func.id)
+        elif isinstance(node.func, ast.Attribute):
+            self.calls.add(node.func.attr)
+        self.generic_visit(node)
+
+
+@pytest.fixture(scope="session")
+def glue_script_symbols(glue_script_ast):
+    """Collect glue script imports and calls in a single AST pass."""
+    collector = _SymbolCollector()
+    collector.visit(glue_script_ast)
+    return ScriptSymbols(imports=collector.imports, calls=collector.calls)
@@ -0,0 +1,55 @@
+"""Shared test data builders for the PL-DSS test suite."""
+
+from pl_dss.config import Config, ThresholdConfig, OverloadThresholds, RecoveryThresholds, AuthorityRules
+
+
+def create_sample_config():
+    """Create an in-memory configuration mirroring config.yaml.
+    
+    Tests that only need a valid Config use this instead of load_config(),
+    so they do not depend on the working directory or YAML parsing.
+    """
+    overload = OverloadThresholds(
+        fixed_deadlines_14d=3,
+        active_high_load_domains=3,
+        avg_energy_score=2
+    )
+    recovery = RecoveryThresholds(
+        fixed_deadlines_14d=1,
+        active_high_load_domains=2,
+        avg_energy_score=4
+    )
+    thresholds = ThresholdConfig(overload=overload, recovery=recovery)
+    
+    downgrade_rules = {
+        "OVERLOADED": [
+            "No new commitments",
+            "Pause technical tool development",
+            "Creative work reduced to minimum viable expression",
+            "Administrative work: only non-delegable tasks"
+        ],
+        "STRESSED": [
+            "Warning: approaching overload",
+            "Discourage new projects",
+            "Suggest creating time buffers"
+        ]
+    }
+    
+    recovery_advice = [
+        "Deadlines have cleared",
+        "High-load domains have reduced",
+        "Energy levels have stabilized"
+    ]
+    
+    authority_derivation = {
+        "OVERLOADED": AuthorityRules(planning="DENIED", execution="DENIED", mode="CONTAINMENT"),
+        "STRESSED": AuthorityRules(planning="DENIED", execution="DENIED", mode="CONTAINMENT"),
+        "NORMAL": AuthorityRules(planning="ALLOWED", execution="DENIED", mode="NORMAL")
+    }
+    
+    return Config(
+        thresholds=thresholds,
+        downgrade_rules=downgrade_rules,
+        recovery_advice=recovery_advice,
+        authority_derivation=authority_derivation
+    )
@@ -4,343 +4,108 @@ Sample GitHub Issue bodies for testing the GitHub Interface Integration.
 These samples cover various scenarios for testing the Issue parser and glue script.
 """
 
-# Valid Issue - NORMAL state
-# This should result in NORMAL state (low stress, good energy)
-VALID_ISSUE_NORMAL = """### Non-movable deadlines (next 14 days)
-
-1
-
-### Active high-load domains
-
-1
+# Section headers used by the Issue template (.github/ISSUE_TEMPLATE/life_checkin.yaml)
+DEADLINES_HEADER = "Non-movable deadlines (next 14 days)"
+DOMAINS_HEADER = "Active high-load domains"
+ENERGY_HEADER = "Energy (1–5, comma-separated)"
+TASKS_HEADER = "Tasks / commitments"
+
+
+def build_issue_body(deadlines="1", domains="1", energy="3,3,3", tasks="Some tasks"):
+    """Build an Issue body in the GitHub Issue template format.
+    
+    Pass None for a field to omit its section entirely.
+    
+    Args:
+        deadlines: Content of the deadlines section
+        domains: Content of the domains section
+        energy: Content of the energy section
+        tasks: Content of the tasks section (may span several lines)
+        
+    Returns:
+        Issue body text with one "### header" section per field
+    """
+    fields = [
+        (DEADLINES_HEADER, deadlines),
+        (DOMAINS_HEADER, domains),
+        (ENERGY_HEADER, energy),
+        (TASKS_HEADER, tasks),
+    ]
+    sections = [f"### {header}\n\n{value}" for header, value in fields if value is not None]
+    return "\n\n".join(sections) + "\n"
 
-### Energy (1–5, comma-separated)
 
-4,4,5
-
-### Tasks / commitments
-
-Review PR #123
-Prepare presentation slides
-"""
+# Valid Issue - NORMAL state
+# This should result in NORMAL state (low stress, good energy)
+VALID_ISSUE_NORMAL = build_issue_body(
+    "1", "1", "4,4,5",
+    "Review PR #123\nPrepare presentation slides"
+)
 
 # Valid Issue - OVERLOADED state
 # This should result in OVERLOADED state (high deadlines, high domains, low energy)
-VALID_ISSUE_OVERLOADED = """### Non-movable deadlines (next 14 days)
-
-4
-
-### Active high-load domains
-
-3
-
-### Energy (1–5, comma-separated)
-
-2,2,2
-
-### Tasks / commitments
-
-ML Homework 3 due Feb 12
-Org meeting prep
-Project deadline Friday
-Research paper review
-"""
+VALID_ISSUE_OVERLOADED = build_issue_body(
+    "4", "3", "2,2,2",
+    "ML Homework 3 due Feb 12\nOrg meeting prep\nProject deadline Friday\nResearch paper review"
+)
 
 # Valid Issue - STRESSED state
 # This should result in STRESSED state (moderate stress)
-VALID_ISSUE_STRESSED = """### Non-movable deadlines (next 14 days)
-
-3
-
-### Active high-load domains
-
-2
-
-### Energy (1–5, comma-separated)
-
-3,3,2
-
-### Tasks / commitments
-
-Team meeting tomorrow
-Code review needed
-"""
+VALID_ISSUE_STRESSED = build_issue_body(
+    "3", "2", "3,3,2",
+    "Team meeting tomorrow\nCode review needed"
+)
 
 # Valid Issue - No tasks (minimal valid input)
-VALID_ISSUE_NO_TASKS = """### Non-movable deadlines (next 14 days)
-
-0
-
-### Active high-load domains
-
-0
-
-### Energy (1–5, comma-separated)
-
-5,5,5
-
-### Tasks / commitments
-
-_No response_
-"""
+VALID_ISSUE_NO_TASKS = build_issue_body("0", "0", "5,5,5", "_No response_")
 
 # Invalid Issue - Missing deadlines field
-INVALID_ISSUE_MISSING_DEADLINES = """### Active high-load domains
-
-2
-
-### Energy (1–5, comma-separated)
-
-3,3,3
-
-### Tasks / commitments
-
-Some tasks here
-"""
+INVALID_ISSUE_MISSING_DEADLINES = build_issue_body(None, "2", "3,3,3", "Some tasks here")
 
 # Invalid Issue - Missing domains field
-INVALID_ISSUE_MISSING_DOMAINS = """### Non-movable deadlines (next 14 days)
-
-2
-
-### Energy (1–5, comma-separated)
-
-3,3,3
-
-### Tasks / commitments
-
-Some tasks here
-"""
+INVALID_ISSUE_MISSING_DOMAINS = build_issue_body("2", None, "3,3,3", "Some tasks here")
 
 # Invalid Issue - Missing energy field
-INVALID_ISSUE_MISSING_ENERGY = """### Non-movable deadlines (next 14 days)
-
-2
-
-### Active high-load domains
-
-1
-
-### Tasks / commitments
-
-Some tasks here
-"""
+INVALID_ISSUE_MISSING_ENERGY = build_issue_body("2", "1", None, "Some tasks here")
 
 # Invalid Issue - Bad energy format (only 2 values)
-INVALID_ISSUE_BAD_ENERGY_COUNT = """### Non-movable deadlines (next 14 days)
-
-1
-
-### Active high-load domains
-
-1
-
-### Energy (1–5, comma-separated)
-
-3,3
-
-### Tasks / commitments
-
-Some tasks
-"""
+INVALID_ISSUE_BAD_ENERGY_COUNT = build_issue_body(energy="3,3")
 
 # Invalid Issue - Bad energy format (4 values)
-INVALID_ISSUE_BAD_ENERGY_TOO_MANY = """### Non-movable deadlines (next 14 days)
-
-1
-
-### Active high-load domains
-
-1
-
-### Energy (1–5, comma-separated)
-
-3,3,3,3
-
-### Tasks / commitments
-
-Some tasks
-"""
+INVALID_ISSUE_BAD_ENERGY_TOO_MANY = build_issue_body(energy="3,3,3,3")
 
 # Invalid Issue - Energy out of range (too high)
-INVALID_ISSUE_ENERGY_OUT_OF_RANGE_HIGH = """### Non-movable deadlines (next 14 days)
-
-1
-
-### Active high-load domains
-
-1
-
-### Energy (1–5, comma-separated)
-
-3,6,3
-
-### Tasks / commitments
-
-Some tasks
-"""
+INVALID_ISSUE_ENERGY_OUT_OF_RANGE_HIGH = build_issue_body(energy="3,6,3")
 
 # Invalid Issue - Energy out of range (too low)
-INVALID_ISSUE_ENERGY_OUT_OF_RANGE_LOW = """### Non-movable deadlines (next 14 days)
-
-1
-
-### Active high-load domains
-
-1
-
-### Energy (1–5, comma-separated)
-
-0,3,3
-
-### Tasks / commitments
-
-Some tasks
-"""
+INVALID_ISSUE_ENERGY_OUT_OF_RANGE_LOW = build_issue_body(energy="0,3,3")
 
 # Invalid Issue - Non-integer deadlines
-INVALID_ISSUE_NON_INTEGER_DEADLINES = """### Non-movable deadlines (next 14 days)
-
-abc
-
-### Active high-load domains
-
-1
-
-### Energy (1–5, comma-separated)
-
-3,3,3
-
-### Tasks / commitments
-
-Some tasks
-"""
+INVALID_ISSUE_NON_INTEGER_DEADLINES = build_issue_body(deadlines="abc")
 
 # Invalid Issue - Non-integer domains
-INVALID_ISSUE_NON_INTEGER_DOMAINS = """### Non-movable deadlines (next 14 days)
-
-1
-
-### Active high-load domains
-
-xyz
-
-### Energy (1–5, comma-separated)
-
-3,3,3
-
-### Tasks / commitments
-
-Some tasks
-"""
+INVALID_ISSUE_NON_INTEGER_DOMAINS = build_issue_body(domains="xyz")
 
 # Invalid Issue - Non-integer energy values
-INVALID_ISSUE_NON_INTEGER_ENERGY = """### Non-movable deadlines (next 14 days)
-
-1
-
-### Active high-load domains
-
-1
-
-### Energy (1–5, comma-separated)
-
-a,b,c
-
-### Tasks / commitments
-
-Some tasks
-"""
+INVALID_ISSUE_NON_INTEGER_ENERGY = build_issue_body(energy="a,b,c")
 
 # Edge case - Boundary values (exact thresholds)
-EDGE_CASE_BOUNDARY_VALUES = """### Non-movable deadlines (next 14 days)
-
-2
-
-### Active high-load domains
-
-2
-
-### Energy (1–5, comma-separated)
-
-3,3,3
-
-### Tasks / commitments
-
-Testing boundary conditions
-"""
+EDGE_CASE_BOUNDARY_VALUES = build_issue_body("2", "2", "3,3,3", "Testing boundary conditions")
 
 # Edge case - Maximum valid values
-EDGE_CASE_MAX_VALUES = """### Non-movable deadlines (next 14 days)
-
-10
-
-### Active high-load domains
-
-10
-
-### Energy (1–5, comma-separated)
-
-5,5,5
-
-### Tasks / commitments
-
-Maximum stress test
-"""
+EDGE_CASE_MAX_VALUES = build_issue_body("10", "10", "5,5,5", "Maximum stress test")
 
 # Edge case - Minimum valid values
-EDGE_CASE_MIN_VALUES = """### Non-movable deadlines (next 14 days)
-
-0
-
-### Active high-load domains
-
-0
-
-### Energy (1–5, comma-separated)
-
-1,1,1
-
-### Tasks / commitments
-
-Minimum stress test
-"""
+EDGE_CASE_MIN_VALUES = build_issue_body("0", "0", "1,1,1", "Minimum stress test")
 
 # Edge case - Whitespace variations
-EDGE_CASE_EXTRA_WHITESPACE = """### Non-movable deadlines (next 14 days)
-
-  2  
-
-### Active high-load domains
-
-  1  
-
-### Energy (1–5, comma-separated)
-
-  3 , 3 , 3  
-
-### Tasks / commitments
-
-Testing whitespace handling
-"""
+EDGE_CASE_EXTRA_WHITESPACE = build_issue_body(
+    "  2  ", "  1  ", "  3 , 3 , 3  ",
+    "Testing whitespace handling"
+)
 
 # Edge case - Empty tasks field
-EDGE_CASE_EMPTY_TASKS = """### Non-movable deadlines (next 14 days)
-
-1
-
-### Active high-load domains
-
-1
-
-### Energy (1–5, comma-separated)
-
-3,3,3
-
-### Tasks / commitments
-
-
-"""
+EDGE_CASE_EMPTY_TASKS = build_issue_body(tasks="")
 
 # Dictionary for easy access
 SAMPLE_ISSUES = {
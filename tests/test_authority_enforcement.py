@@ -1,4 +1,4 @@
-"""Property-based tests for authority enforcement in GitHub Interface.
+"""Equivalence-class tests for authority enforcement in GitHub Interface.
 
 Tests that authority is correctly enforced across all system states and that
 planning operations respect authority boundaries.
@@ -8,130 +8,59 @@ Requirements: 7.1, 7.2, 7.3, 7.4, 7.5
 """
 
 import pytest
-from hypothesis import given, strategies as st, settings
 
-from pl_dss.config import Config, ThresholdConfig, OverloadThresholds, RecoveryThresholds, AuthorityRules
 from pl_dss.evaluator import StateInputs, evaluate_state
 from pl_dss.rules import get_active_rules
 from pl_dss.authority import derive_authority
 
+from tests.fixtures import create_sample_config
 
-def create_sample_config():
-    """Create a sample configuration for testing."""
-    overload = OverloadThresholds(
-        fixed_deadlines_14d=3,
-        active_high_load_domains=3,
-        avg_energy_score=2
-    )
-    recovery = RecoveryThresholds(
-        fixed_deadlines_14d=1,
-        active_high_load_domains=2,
-        avg_energy_score=4
-    )
-    thresholds = ThresholdConfig(overload=overload, recovery=recovery)
-    
-    downgrade_rules = {
-        "OVERLOADED": [
-            "No new commitments",
-            "Pause technical tool development"
-        ],
-        "STRESSED": [
-            "Warning: approaching overload",
-            "Discourage new projects"
-        ]
-    }
-    
-    recovery_advice = [
-        "Deadlines have cleared",
-        "Energy levels have stabilized"
-    ]
-    
-    authority_derivation = {
-        "OVERLOADED": AuthorityRules(planning="DENIED", execution="DENIED", mode="CONTAINMENT"),
-        "STRESSED": AuthorityRules(planning="DENIED", execution="DENIED", mode="CONTAINMENT"),
-        "NORMAL": AuthorityRules(planning="ALLOWED", execution="DENIED", mode="NORMAL")
-    }
-    
-    return Config(
-        thresholds=thresholds,
-        downgrade_rules=downgrade_rules,
-        recovery_advice=recovery_advice,
-        authority_derivation=authority_derivation
-    )
 
+# Built once at import: the pipeline only reads from the config, so every
+# test case can share the same instance.
+SAMPLE_CONFIG = create_sample_config()
 
-# Strategy for generating StateInputs that result in STRESSED or OVERLOADED states
-@st.composite
-def stressed_or_overloaded_inputs(draw):
-    """Generate StateInputs that result in STRESSED or OVERLOADED state.
-    
-    STRESSED: Exactly 1 condition met
-    OVERLOADED: 2 or more conditions met
-    
-    Conditions:
-    - fixed_deadlines_14d >= 3
-    - active_high_load_domains >= 3
-    - avg_energy_score <= 2
-    """
-    # Generate inputs that meet at least 1 condition
-    deadlines = draw(st.integers(min_value=0, max_value=10))
-    domains = draw(st.integers(min_value=0, max_value=10))
-    energy = draw(st.lists(st.integers(min_value=1, max_value=5), min_size=3, max_size=3))
-    
-    # Count conditions met
-    conditions_met = 0
-    if deadlines >= 3:
-        conditions_met += 1
-    if domains >= 3:
-        conditions_met += 1
-    if sum(energy) / len(energy) <= 2:
-        conditions_met += 1
-    
-    # If no conditions met, force at least one
-    if conditions_met == 0:
-        choice = draw(st.integers(min_value=0, max_value=2))
-        if choice == 0:
-            deadlines = draw(st.integers(min_value=3, max_value=10))
-        elif choice == 1:
-            domains = draw(st.integers(min_value=3, max_value=10))
-        else:
-            energy = [1, 1, 1]  # avg = 1.0 <= 2
-    
-    return StateInputs(
-        fixed_deadlines_14d=deadlines,
-        active_high_load_domains=domains,
-        energy_scores_last_3_days=energy
-    )
+# States in which the system must be in containment
+CONTAINMENT_STATES = frozenset({"STRESSED", "OVERLOADED"})
 
+# Expected (planning, mode) for each Decision Core state
+EXPECTED_AUTHORITY = {
+    "OVERLOADED": ("DENIED", "CONTAINMENT"),
+    "STRESSED": ("DENIED", "CONTAINMENT"),
+    "NORMAL": ("ALLOWED", "NORMAL"),
+}
 
-# Strategy for generating StateInputs that result in NORMAL state
-@st.composite
-def normal_inputs(draw):
-    """Generate StateInputs that result in NORMAL state.
-    
-    NORMAL: 0 conditions met
-    
-    Conditions (all must be false):
-    - fixed_deadlines_14d < 3
-    - active_high_load_domains < 3
-    - avg_energy_score > 2
-    """
-    deadlines = draw(st.integers(min_value=0, max_value=2))
-    domains = draw(st.integers(min_value=0, max_value=2))
-    # Energy scores that average > 2
-    energy = draw(st.lists(st.integers(min_value=3, max_value=5), min_size=3, max_size=3))
-    
-    return StateInputs(
-        fixed_deadlines_14d=deadlines,
-        active_high_load_domains=domains,
-        energy_scores_last_3_days=energy
-    )
+
+# Equivalence classes over the three overload conditions:
+# - fixed_deadlines_14d >= 3
+# - active_high_load_domains >= 3
+# - avg_energy_score <= 2
+# Each case is (deadlines, domains, energy) and sits on or next to a threshold.
+
+# STRESSED (exactly 1 condition met) or OVERLOADED (2 or more conditions met)
+STRESSED_OR_OVERLOADED_CASES = [
+    (3, 0, [3, 3, 3]),    # deadlines only, exact threshold
+    (0, 3, [3, 3, 3]),    # domains only, exact threshold
+    (0, 0, [2, 2, 2]),    # energy only, exact threshold
+    (2, 2, [1, 2, 3]),    # energy only, mixed scores averaging 2
+    (3, 3, [3, 3, 3]),    # deadlines + domains
+    (3, 0, [1, 1, 1]),    # deadlines + energy
+    (0, 3, [2, 2, 2]),    # domains + energy
+    (10, 10, [1, 1, 1]),  # all conditions met
+]
+
+# NORMAL (0 conditions met)
+NORMAL_CASES = [
+    (0, 0, [5, 5, 5]),    # far from every threshold
+    (2, 2, [3, 3, 3]),    # just below every threshold
+    (2, 2, [2, 2, 3]),    # energy average just above threshold
+    (1, 0, [3, 4, 5]),
+]
 
 
 # Property 9: Authority Enforcement - Planning Denial
-@given(inputs=stressed_or_overloaded_inputs())
-@settings(max_examples=100)
-def test_property_planning_denial(inputs):
+@pytest.mark.parametrize("deadlines,domains,energy", STRESSED_OR_OVERLOADED_CASES)
+def test_property_planning_denial(deadlines, domains, energy):
     """Property 9: Authority Enforcement - Planning Denial
     
     For any inputs that result in STRESSED or OVERLOADED state,
@@ -140,7 +69,12 @@ def test_property_planning_denial(inputs):
     Feature: github-interface, Property 9: Planning Denial
     Validates: Requirements 7.1, 7.2, 7.4
     """
-    config = create_sample_config()
+    config = SAMPLE_CONFIG
+    inputs = StateInputs(
+        fixed_deadlines_14d=deadlines,
+        active_high_load_domains=domains,
+        energy_scores_last_3_days=energy
+    )
     
     # Evaluate state
     state_result = evaluate_state(inputs, config)
@@ -152,21 +86,19 @@ def test_property_planning_denial(inputs):
     authority = derive_authority(state_result, rule_result)
     
     # Property: If state is STRESSED or OVERLOADED, planning must be DENIED
-    if state_result.state in ["STRESSED", "OVERLOADED"]:
-        assert authority.planning == "DENIED", (
-            f"Planning should be DENIED for {state_result.state} state, "
-            f"but got {authority.planning}"
-        )
-        assert authority.mode == "CONTAINMENT", (
-            f"Mode should be CONTAINMENT for {state_result.state} state, "
-            f"but got {authority.mode}"
-        )
+    assert state_result.state in CONTAINMENT_STATES, (
+        f"Expected STRESSED or OVERLOADED state for STRESSED_OR_OVERLOADED_CASES inputs, "
+        f"got {state_result.state}"
+    )
+    assert (authority.planning, authority.mode) == EXPECTED_AUTHORITY[state_result.state], (
+        f"Expected planning DENIED and mode CONTAINMENT for {state_result.state} state, "
+        f"but got planning {authority.planning} and mode {authority.mode}"
+    )
 
 
 # Property 10: Authority Enforcement - Planning Allowance
-@given(inputs=normal_inputs())
-@settings(max_examples=100)
-def test_property_planning_allowance(inputs):
+@pytest.mark.parametrize("deadlines,domains,energy", NORMAL_CASES)
+def test_property_planning_allowance(deadlines, domains, energy):
     """Property 10: Authority Enforcement - Planning Allowance
     
     For any inputs that result in NORMAL state,
@@ -175,7 +107,12 @@ def test_property_planning_allowance(inputs):
     Feature: github-interface, Property 10: Planning Allowance
     Validates: Requirements 7.3, 7.4
     """
-    config = create_sample_config()
+    config = SAMPLE_CONFIG
+    inputs = StateInputs(
+        fixed_deadlines_14d=deadlines,
+        active_high_load_domains=domains,
+        energy_scores_last_3_days=energy
+    )
     
     # Evaluate state
     state_result = evaluate_state(inputs, config)
@@ -188,25 +125,21 @@ def test_property_planning_allowance(inputs):
     
     # Property: If state is NORMAL, planning must be ALLOWED
     assert state_result.state == "NORMAL", (
-        f"Expected NORMAL state from normal_inputs generator, got {state_result.state}"
-    )
-    assert authority.planning == "ALLOWED", (
-        f"Planning should be ALLOWED for NORMAL state, but got {authority.planning}"
+        f"Expected NORMAL state for NORMAL_CASES inputs, got {state_result.state}"
     )
-    assert authority.mode == "NORMAL", (
-        f"Mode should be NORMAL for NORMAL state, but got {authority.mode}"
+    assert (authority.planning, authority.mode) == EXPECTED_AUTHORITY["NORMAL"], (
+        f"Expected planning ALLOWED and mode NORMAL for NORMAL state, "
+        f"but got planning {authority.planning} and mode {authority.mode}"
     )
 
 
 # Property 11: Authority Check Precedence
-@given(
-    inputs=st.one_of(
-        stressed_or_overloaded_inputs(),
-        normal_inputs()
-    )
-)
-@settings(max_examples=100)
-def test_property_authority_check_precedence(inputs):
+@pytest.mark.parametrize("deadlines,domains,energy,expected_state", [
+    (4, 3, [2, 2, 2], "OVERLOADED"),
+    (3, 0, [3, 3, 3], "STRESSED"),
+    (0, 0, [5, 5, 5], "NORMAL"),
+])
+def test_property_authority_check_precedence(deadlines, domains, energy, expected_state):
     """Property 11: Authority Check Precedence
     
     For any code path that involves planning, the authority check should occur
@@ -220,7 +153,12 @@ def test_property_authority_check_precedence(inputs):
     Feature: github-interface, Property 11: Authority Check Precedence
     Validates: Requirements 7.4, 7.5
     """
-    config = create_sample_config()
+    config = SAMPLE_CONFIG
+    inputs = StateInputs(
+        fixed_deadlines_14d=deadlines,
+        active_high_load_domains=domains,
+        energy_scores_last_3_days=energy
+    )
     
     # Step 1: Evaluate state (Decision Core)
     state_result = evaluate_state(inputs, config)
@@ -231,6 +169,10 @@ def test_property_authority_check_precedence(inputs):
     # Step 3: Derive authority (must happen before any planning)
     authority = derive_authority(state_result, rule_result)
     
+    assert state_result.state == expected_state, (
+        f"Expected {expected_state} state, got {state_result.state}"
+    )
+    
     # Property: Authority must be derived from Decision Core output
     assert authority.state == state_result.state, (
         "Authority state must match Decision Core state"
@@ -240,20 +182,11 @@ def test_property_authority_check_precedence(inputs):
     )
     
     # Property: Authority permissions must be consistent with state
-    if state_result.state in ["STRESSED", "OVERLOADED"]:
-        assert authority.planning == "DENIED", (
-            f"Planning must be DENIED for {state_result.state} state"
-        )
-        assert authority.mode == "CONTAINMENT", (
-            f"Mode must be CONTAINMENT for {state_result.state} state"
-        )
-    elif state_result.state == "NORMAL":
-        assert authority.planning == "ALLOWED", (
-            "Planning must be ALLOWED for NORMAL state"
-        )
-        assert authority.mode == "NORMAL", (
-            "Mode must be NORMAL for NORMAL state"
-        )
+    expected_planning, expected_mode = EXPECTED_AUTHORITY[state_result.state]
+    assert (authority.planning, authority.mode) == (expected_planning, expected_mode), (
+        f"Planning must be {expected_planning} and mode must be {expected_mode} "
+        f"for {state_result.state} state"
+    )
     
     # Property: Execution is always DENIED (immutable)
     assert authority.execution == "DENIED", (
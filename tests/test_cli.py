@@ -13,28 +13,38 @@ from unittest.mock import patch, MagicMock
 from pathlib import Path
 
 from pl_dss.plo_cli import (
+    COMMAND_TABLE,
     create_parser,
     cmd_scenario_run,
     cmd_scenario_run_all,
     cmd_scenario_validate,
     cmd_evaluate,
-    main
+    evaluate_inputs,
+    main,
+    run_cli
 )
-from pl_dss.config import load_config
 
+from tests.fixtures import create_sample_config
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def config():
-    """Load test configuration."""
-    return load_config('config.yaml')
+    """In-memory test configuration (config.yaml loading is covered in test_config.py)."""
+    return create_sample_config()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_scenario_file():
     """Path to test scenario file."""
     return 'scenarios/test_scenarios.yaml'
 
 
+@pytest.fixture(scope="session")
+def parser():
+    """Shared CLI parser (parse_args returns a fresh Namespace per call)."""
+    return create_parser()
+
+
 class TestParserCreation:
     """Tests for CLI parser creation."""
     
@@ -47,13 +57,11 @@ class TestParserCreation:
         assert parser is not None
         assert parser.prog == 'plo'
     
-    def test_parser_has_all_commands(self):
+    def test_parser_has_all_commands(self, parser):
         """Test that parser has all required commands.
         
         Requirements: 11.1, 11.2, 11.3
         """
-        parser = create_parser()
-        
         # Test scenario run command
         args = parser.parse_args(['scenario', 'run', '--name', 'test', '--file', 'test.yaml'])
         assert args.command == 'scenario'
@@ -84,9 +92,8 @@ class TestScenarioRunCommand:
     Requirements: 11.1, 11.4, 11.5
     """
     
-    def test_scenario_run_success(self, config, test_scenario_file, capsys):
+    def test_scenario_run_success(self, parser, config, test_scenario_file, capsys):
         """Test successful scenario run returns exit code 0."""
-        parser = create_parser()
         args = parser.parse_args(['scenario', 'run', '--name', 'Sudden Load Spike', '--file', test_scenario_file])
         
         exit_code = cmd_scenario_run(args, config)
@@ -98,9 +105,8 @@ class TestScenarioRunCommand:
         assert 'SCENARIO: Sudden Load Spike' in captured.out
         assert 'STATE: OVERLOADED' in captured.out
     
-    def test_scenario_run_not_found(self, config, test_scenario_file, capsys):
+    def test_scenario_run_not_found(self, parser, config, test_scenario_file, capsys):
         """Test scenario run with non-existent scenario returns exit code 1."""
-        parser = create_parser()
         args = parser.parse_args(['scenario', 'run', '--name', 'NonExistent', '--file', test_scenario_file])
         
         exit_code = cmd_scenario_run(args, config)
@@ -111,9 +117,8 @@ class TestScenarioRunCommand:
         captured = capsys.readouterr()
         assert 'ERROR: Scenario not found' in captured.err
     
-    def test_scenario_run_invalid_file(self, config, capsys):
+    def test_scenario_run_invalid_file(self, parser, config, capsys):
         """Test scenario run with invalid file returns exit code 1."""
-        parser = create_parser()
         args = parser.parse_args(['scenario', 'run', '--name', 'test', '--file', 'nonexistent.yaml'])
         
         exit_code = cmd_scenario_run(args, config)
@@ -131,9 +136,8 @@ class TestScenarioRunAllCommand:
     Requirements: 11.2, 11.4, 11.5
     """
     
-    def test_scenario_run_all_success(self, config, test_scenario_file, capsys):
+    def test_scenario_run_all_success(self, parser, config, test_scenario_file, capsys):
         """Test successful run-all returns exit code 0."""
-        parser = create_parser()
         args = parser.parse_args(['scenario', 'run-all', '--file', test_scenario_file])
         
         exit_code = cmd_scenario_run_all(args, config)
@@ -146,9 +150,8 @@ class TestScenarioRunAllCommand:
         assert 'SCENARIO: Gradual Stress' in captured.out
         assert 'SCENARIO: Normal Operation' in captured.out
     
-    def test_scenario_run_all_invalid_file(self, config, capsys):
+    def test_scenario_run_all_invalid_file(self, parser, config, capsys):
         """Test run-all with invalid file returns exit code 1."""
-        parser = create_parser()
         args = parser.parse_args(['scenario', 'run-all', '--file', 'nonexistent.yaml'])
         
         exit_code = cmd_scenario_run_all(args, config)
@@ -166,9 +169,8 @@ class TestScenarioValidateCommand:
     Requirements: 11.3, 11.4, 11.5
     """
     
-    def test_scenario_validate_success(self, config, test_scenario_file, capsys):
+    def test_scenario_validate_success(self, parser, config, test_scenario_file, capsys):
         """Test successful validation returns exit code 0."""
-        parser = create_parser()
         args = parser.parse_args(['scenario', 'validate', '--file', test_scenario_file])
         
         exit_code = cmd_scenario_validate(args, config)
@@ -180,9 +182,8 @@ class TestScenarioValidateCommand:
         assert 'Scenario file is valid' in captured.out
         assert test_scenario_file in captured.out
     
-    def test_scenario_validate_invalid_file(self, config, capsys):
+    def test_scenario_validate_invalid_file(self, parser, config, capsys):
         """Test validation with invalid file returns exit code 1."""
-        parser = create_parser()
         args = parser.parse_args(['scenario', 'validate', '--file', 'nonexistent.yaml'])
         
         exit_code = cmd_scenario_validate(args, config)
@@ -201,9 +202,8 @@ class TestEvaluateCommand:
     Requirements: 11.3, 11.4, 11.5
     """
     
-    def test_evaluate_success(self, config, capsys):
+    def test_evaluate_success(self, parser, config, capsys):
         """Test successful evaluation returns exit code 0."""
-        parser = create_parser()
         args = parser.parse_args(['evaluate', '--deadlines', '4', '--domains', '3', '--energy', '2', '2', '2'])
         
         exit_code = cmd_evaluate(args, config)
@@ -217,24 +217,19 @@ class TestEvaluateCommand:
         assert 'planning: DENIED' in captured.out
         assert 'execution: DENIED' in captured.out
     
-    def test_evaluate_normal_state(self, config, capsys):
+    def test_evaluate_normal_state(self, parser, config):
         """Test evaluation with normal state inputs."""
-        parser = create_parser()
         args = parser.parse_args(['evaluate', '--deadlines', '1', '--domains', '1', '--energy', '4', '4', '5'])
         
-        exit_code = cmd_evaluate(args, config)
-        
-        assert exit_code == 0
+        authority = evaluate_inputs(args, config)
         
-        # Verify normal state output
-        captured = capsys.readouterr()
-        assert 'STATE: NORMAL' in captured.out
-        assert 'planning: ALLOWED' in captured.out
-        assert 'execution: DENIED' in captured.out
+        # Verify normal state authority
+        assert authority.state == 'NORMAL'
+        assert authority.planning == 'ALLOWED'
+        assert authority.execution == 'DENIED'
     
-    def test_evaluate_invalid_energy_scores(self, config, capsys):
+    def test_evaluate_invalid_energy_scores(self, parser, config, capsys):
         """Test evaluation with invalid energy scores returns exit code 1."""
-        parser = create_parser()
         args = parser.parse_args(['evaluate', '--deadlines', '1', '--domains', '1', '--energy', '0', '0', '0'])
         
         exit_code = cmd_evaluate(args, config)
@@ -254,39 +249,48 @@ class TestMainFunction:
     
     def test_main_no_command_exits_with_error(self):
         """Test main with no command exits with code 1."""
-        with patch('sys.argv', ['plo']):
-            with pytest.raises(SystemExit) as exc_info:
-                main()
-            assert exc_info.value.code == 1
-    
-    def test_main_scenario_run_success(self):
-        """Test main with scenario run command exits with code 0."""
-        with patch('sys.argv', ['plo', 'scenario', 'run', '--name', 'Sudden Load Spike', '--file', 'scenarios/test_scenarios.yaml']):
-            with pytest.raises(SystemExit) as exc_info:
-                main()
-            assert exc_info.value.code == 0
-    
-    def test_main_evaluate_success(self):
-        """Test main with evaluate command exits with code 0."""
-        with patch('sys.argv', ['plo', 'evaluate', '--deadlines', '1', '--domains', '1', '--energy', '4', '4', '5']):
-            with pytest.raises(SystemExit) as exc_info:
-                main()
-            assert exc_info.value.code == 0
+        with pytest.raises(SystemExit) as exc_info:
+            main([])
+        assert exc_info.value.code == 1
     
     def test_main_invalid_config_exits_with_error(self):
         """Test main with invalid config file exits with code 1."""
-        with patch('sys.argv', ['plo', '--config', 'nonexistent.yaml', 'evaluate', '--deadlines', '1', '--domains', '1', '--energy', '4', '4', '5']):
-            with pytest.raises(SystemExit) as exc_info:
-                main()
-            assert exc_info.value.code == 1
+        assert run_cli(['--config', 'nonexistent.yaml', 'evaluate', '--deadlines', '1', '--domains', '1', '--energy', '4', '4', '5']) == 1
     
     def test_main_keyboard_interrupt_exits_with_130(self):
         """Test main handles KeyboardInterrupt with exit code 130."""
-        with patch('sys.argv', ['plo', 'evaluate', '--deadlines', '1', '--domains', '1', '--energy', '4', '4', '5']):
-            with patch('pl_dss.plo_cli.load_config', side_effect=KeyboardInterrupt()):
-                with pytest.raises(SystemExit) as exc_info:
-                    main()
-                assert exc_info.value.code == 130
+        with patch('pl_dss.plo_cli.load_config', side_effect=KeyboardInterrupt()):
+            assert run_cli(['evaluate', '--deadlines', '1', '--domains', '1', '--energy', '4', '4', '5']) == 130
+
+
+# Commands covered by exit-code tests (validate-v03 shells out to pytest itself)
+EXIT_CODE_COMMANDS = [key for key in COMMAND_TABLE if key != ('validate-v03', None)]
+
+
+@pytest.fixture(scope="module")
+def success_args(parser, test_scenario_file):
+    """Parsed argument vectors for successful operations, keyed by COMMAND_TABLE key."""
+    return {
+        ('scenario', 'run'): parser.parse_args(['scenario', 'run', '--name', 'Sudden Load Spike', '--file', test_scenario_file]),
+        ('scenario', 'run-all'): parser.parse_args(['scenario', 'run-all', '--file', test_scenario_file]),
+        ('scenario', 'validate'): parser.parse_args(['scenario', 'validate', '--file', test_scenario_file]),
+        ('evaluate', None): parser.parse_args(['evaluate', '--deadlines', '1', '--domains', '1', '--energy', '4', '4', '5']),
+    }
+
+
+@pytest.fixture(scope="module")
+def error_args(parser, test_scenario_file):
+    """Parsed argument vectors for failing operations, keyed by COMMAND_TABLE key."""
+    return {
+        # scenario run with non-existent scenario
+        ('scenario', 'run'): parser.parse_args(['scenario', 'run', '--name', 'NonExistent', '--file', test_scenario_file]),
+        # scenario run-all with invalid file
+        ('scenario', 'run-all'): parser.parse_args(['scenario', 'run-all', '--file', 'nonexistent.yaml']),
+        # scenario validate with invalid file
+        ('scenario', 'validate'): parser.parse_args(['scenario', 'validate', '--file', 'nonexistent.yaml']),
+        # evaluate with invalid energy scores
+        ('evaluate', None): parser.parse_args(['evaluate', '--deadlines', '1', '--domains', '1', '--energy', '0', '0', '0']),
+    }
 
 
 class TestExitCodes:
@@ -295,42 +299,16 @@ class TestExitCodes:
     Requirements: 11.5
     """
     
-    def test_all_success_cases_return_zero(self, config, test_scenario_file):
-        """Test that all successful operations return exit code 0."""
-        parser = create_parser()
-        
-        # scenario run success
-        args = parser.parse_args(['scenario', 'run', '--name', 'Sudden Load Spike', '--file', test_scenario_file])
-        assert cmd_scenario_run(args, config) == 0
-        
-        # scenario run-all success
-        args = parser.parse_args(['scenario', 'run-all', '--file', test_scenario_file])
-        assert cmd_scenario_run_all(args, config) == 0
-        
-        # scenario validate success
-        args = parser.parse_args(['scenario', 'validate', '--file', test_scenario_file])
-        assert cmd_scenario_validate(args, config) == 0
-        
-        # evaluate success
-        args = parser.parse_args(['evaluate', '--deadlines', '1', '--domains', '1', '--energy', '4', '4', '5'])
-        assert cmd_evaluate(args, config) == 0
+    @pytest.mark.parametrize("command", EXIT_CODE_COMMANDS)
+    def test_success_case_returns_zero(self, config, success_args, command):
+        """Test that each successful operation returns exit code 0."""
+        args = success_args[command]
+        assert (args.command, getattr(args, 'scenario_command', None)) == command
+        assert COMMAND_TABLE[command](args, config) == 0
     
-    def test_all_error_cases_return_nonzero(self, config):
-        """Test that all error cases return non-zero exit codes."""
-        parser = create_parser()
-        
-        # scenario run with non-existent scenario
-        args = parser.parse_args(['scenario', 'run', '--name', 'NonExistent', '--file', 'scenarios/test_scenarios.yaml'])
-        assert cmd_scenario_run(args, config) != 0
-        
-        # scenario run-all with invalid file
-        args = parser.parse_args(['scenario', 'run-all', '--file', 'nonexistent.yaml'])
-        assert cmd_scenario_run_all(args, config) != 0
-        
-        # scenario validate with invalid file
-        args = parser.parse_args(['scenario', 'validate', '--file', 'nonexistent.yaml'])
-        assert cmd_scenario_validate(args, config) != 0
-        
-        # evaluate with invalid energy scores
-        args = parser.parse_args(['evaluate', '--deadlines', '1', '--domains', '1', '--energy', '0', '0', '0'])
-        assert cmd_evaluate(args, config) != 0
+    @pytest.mark.parametrize("command", EXIT_CODE_COMMANDS)
+    def test_error_case_returns_nonzero(self, config, error_args, command):
+        """Test that each error case returns a non-zero exit code."""
+        args = error_args[command]
+        assert (args.command, getattr(args, 'scenario_command', None)) == command
+        assert COMMAND_TABLE[command](args, config) != 0
@@ -8,7 +8,7 @@ Tests cover:
 """
 
 import pytest
-import tempfile
+import textwrap
 from pathlib import Path
 from pl_dss.config import (
     load_config,
@@ -20,9 +20,24 @@ from pl_dss.config import (
     AuthorityRules
 )
 
+from tests.fixtures import create_sample_config
+
+
+# Thresholds, downgrade rules and recovery advice shared by the error-path
+# tests; each test appends its own authority_derivation variant
+_BASE_YAML = textwrap.dedent("""\
+    thresholds:
+      overload: {fixed_deadlines_14d: 3, active_high_load_domains: 3, avg_energy_score: 2}
+      recovery: {fixed_deadlines_14d: 1, active_high_load_domains: 2, avg_energy_score: 4}
+    downgrade_rules:
+      OVERLOADED: ["No new commitments"]
+      STRESSED: ["Warning: approaching overload"]
+    recovery_advice: ["Deadlines have cleared"]
+""")
+
 
 # Test 1: Load valid configuration with authority_derivation
-def test_load_valid_configuration_with_authority_derivation(tmp_path):
+def test_load_valid_configuration_with_authority_derivation(yaml_file):
     """Test loading a valid configuration file with authority_derivation section.
     
     Requirements: 7.1, 7.2
@@ -66,11 +81,10 @@ authority_derivation:
     mode: NORMAL
 """
     
-    config_file = tmp_path / "test_config.yaml"
-    config_file.write_text(config_content)
+    config_file = yaml_file(config_content)
     
     # Load configuration
-    config = load_config(str(config_file))
+    config = load_config(config_file)
     
     # Verify configuration structure
     assert isinstance(config, Config)
@@ -124,39 +138,19 @@ authority_derivation:
 
 
 # Test 2: Missing authority_derivation section
-def test_missing_authority_derivation_section(tmp_path):
+def test_missing_authority_derivation_section(yaml_file):
     """Test that missing authority_derivation section raises ConfigurationError.
     
     Requirements: 7.4
     """
     # Create configuration without authority_derivation
-    config_content = """
-thresholds:
-  overload:
-    fixed_deadlines_14d: 3
-    active_high_load_domains: 3
-    avg_energy_score: 2
-  recovery:
-    fixed_deadlines_14d: 1
-    active_high_load_domains: 2
-    avg_energy_score: 4
-
-downgrade_rules:
-  OVERLOADED:
-    - "No new commitments"
-  STRESSED:
-    - "Warning: approaching overload"
-
-recovery_advice:
-  - "Deadlines have cleared"
-"""
+    config_content = _BASE_YAML
     
-    config_file = tmp_path / "test_config_no_authority.yaml"
-    config_file.write_text(config_content)
+    config_file = yaml_file(config_content)
     
     # Attempt to load configuration
     with pytest.raises(ConfigurationError) as exc_info:
-        load_config(str(config_file))
+        load_config(config_file)
     
     # Verify error message mentions missing authority_derivation
     error_message = str(exc_info.value)
@@ -164,32 +158,13 @@ recovery_advice:
 
 
 # Test 3: Invalid authority values - invalid planning permission
-def test_invalid_planning_permission_value(tmp_path):
+def test_invalid_planning_permission_value(yaml_file):
     """Test that invalid planning permission value raises ConfigurationError.
     
     Requirements: 7.4
     """
     # Create configuration with invalid planning value
-    config_content = """
-thresholds:
-  overload:
-    fixed_deadlines_14d: 3
-    active_high_load_domains: 3
-    avg_energy_score: 2
-  recovery:
-    fixed_deadlines_14d: 1
-    active_high_load_domains: 2
-    avg_energy_score: 4
-
-downgrade_rules:
-  OVERLOADED:
-    - "No new commitments"
-  STRESSED:
-    - "Warning: approaching overload"
-
-recovery_advice:
-  - "Deadlines have cleared"
-
+    config_content = _BASE_YAML + """
 authority_derivation:
   OVERLOADED:
     planning: INVALID_VALUE
@@ -205,12 +180,11 @@ authority_derivation:
     mode: NORMAL
 """
     
-    config_file = tmp_path / "test_config_invalid_planning.yaml"
-    config_file.write_text(config_content)
+    config_file = yaml_file(config_content)
     
     # Attempt to load configuration
     with pytest.raises(ConfigurationError) as exc_info:
-        load_config(str(config_file))
+        load_config(config_file)
     
     # Verify error message mentions invalid planning value
     error_message = str(exc_info.value)
@@ -219,32 +193,13 @@ authority_derivation:
 
 
 # Test 4: Invalid authority values - invalid execution permission
-def test_invalid_execution_permission_value(tmp_path):
+def test_invalid_execution_permission_value(yaml_file):
     """Test that invalid execution permission value raises ConfigurationError.
     
     Requirements: 7.4
     """
     # Create configuration with invalid execution value
-    config_content = """
-thresholds:
-  overload:
-    fixed_deadlines_14d: 3
-    active_high_load_domains: 3
-    avg_energy_score: 2
-  recovery:
-    fixed_deadlines_14d: 1
-    active_high_load_domains: 2
-    avg_energy_score: 4
-
-downgrade_rules:
-  OVERLOADED:
-    - "No new commitments"
-  STRESSED:
-    - "Warning: approaching overload"
-
-recovery_advice:
-  - "Deadlines have cleared"
-
+    config_content = _BASE_YAML + """
 authority_derivation:
   OVERLOADED:
     planning: DENIED
@@ -260,12 +215,11 @@ authority_derivation:
     mode: NORMAL
 """
     
-    config_file = tmp_path / "test_config_invalid_execution.yaml"
-    config_file.write_text(config_content)
+    config_file = yaml_file(config_content)
     
     # Attempt to load configuration
     with pytest.raises(ConfigurationError) as exc_info:
-        load_config(str(config_file))
+        load_config(config_file)
     
     # Verify error message mentions invalid execution value
     error_message = str(exc_info.value)
@@ -274,32 +228,13 @@ authority_derivation:
 
 
 # Test 5: Invalid authority values - invalid mode
-def test_invalid_mode_value(tmp_path):
+def test_invalid_mode_value(yaml_file):
     """Test that invalid mode value raises ConfigurationError.
     
     Requirements: 7.4
     """
     # Create configuration with invalid mode value
-    config_content = """
-thresholds:
-  overload:
-    fixed_deadlines_14d: 3
-    active_high_load_domains: 3
-    avg_energy_score: 2
-  recovery:
-    fixed_deadlines_14d: 1
-    active_high_load_domains: 2
-    avg_energy_score: 4
-
-downgrade_rules:
-  OVERLOADED:
-    - "No new commitments"
-  STRESSED:
-    - "Warning: approaching overload"
-
-recovery_advice:
-  - "Deadlines have cleared"
-
+    config_content = _BASE_YAML + """
 authority_derivation:
   OVERLOADED:
     planning: DENIED
@@ -315,12 +250,11 @@ authority_derivation:
     mode: NORMAL
 """
     
-    config_file = tmp_path / "test_config_invalid_mode.yaml"
-    config_file.write_text(config_content)
+    config_file = yaml_file(config_content)
     
     # Attempt to load configuration
     with pytest.raises(ConfigurationError) as exc_info:
-        load_config(str(config_file))
+        load_config(config_file)
     
     # Verify error message mentions invalid mode value
     error_message = str(exc_info.value)
@@ -329,32 +263,13 @@ authority_derivation:
 
 
 # Test 6: Missing state in authority_derivation
-def test_missing_state_in_authority_derivation(tmp_path):
+def test_missing_state_in_authority_derivation(yaml_file):
     """Test that missing state in authority_derivation raises ConfigurationError.
     
     Requirements: 7.4
     """
     # Create configuration missing NORMAL state
-    config_content = """
-thresholds:
-  overload:
-    fixed_deadlines_14d: 3
-    active_high_load_domains: 3
-    avg_energy_score: 2
-  recovery:
-    fixed_deadlines_14d: 1
-    active_high_load_domains: 2
-    avg_energy_score: 4
-
-downgrade_rules:
-  OVERLOADED:
-    - "No new commitments"
-  STRESSED:
-    - "Warning: approaching overload"
-
-recovery_advice:
-  - "Deadlines have cleared"
-
+    config_content = _BASE_YAML + """
 authority_derivation:
   OVERLOADED:
     planning: DENIED
@@ -366,12 +281,11 @@ authority_derivation:
     mode: CONTAINMENT
 """
     
-    config_file = tmp_path / "test_config_missing_state.yaml"
-    config_file.write_text(config_content)
+    config_file = yaml_file(config_content)
     
     # Attempt to load configuration
     with pytest.raises(ConfigurationError) as exc_info:
-        load_config(str(config_file))
+        load_config(config_file)
     
     # Verify error message mentions missing state
     error_message = str(exc_info.value)
@@ -379,32 +293,13 @@ authority_derivation:
 
 
 # Test 7: Missing required key in authority state
-def test_missing_required_key_in_authority_state(tmp_path):
+def test_missing_required_key_in_authority_state(yaml_file):
     """Test that missing required key in authority state raises ConfigurationError.
     
     Requirements: 7.4
     """
     # Create configuration with missing 'mode' key
-    config_content = """
-thresholds:
-  overload:
-    fixed_deadlines_14d: 3
-    active_high_load_domains: 3
-    avg_energy_score: 2
-  recovery:
-    fixed_deadlines_14d: 1
-    active_high_load_domains: 2
-    avg_energy_score: 4
-
-downgrade_rules:
-  OVERLOADED:
-    - "No new commitments"
-  STRESSED:
-    - "Warning: approaching overload"
-
-recovery_advice:
-  - "Deadlines have cleared"
-
+    config_content = _BASE_YAML + """
 authority_derivation:
   OVERLOADED:
     planning: DENIED
@@ -419,12 +314,11 @@ authority_derivation:
     mode: NORMAL
 """
     
-    config_file = tmp_path / "test_config_missing_key.yaml"
-    config_file.write_text(config_content)
+    config_file = yaml_file(config_content)
     
     # Attempt to load configuration
     with pytest.raises(ConfigurationError) as exc_info:
-        load_config(str(config_file))
+        load_config(config_file)
     
     # Verify error message mentions missing key
     error_message = str(exc_info.value)
@@ -432,13 +326,12 @@ authority_derivation:
 
 
 # Test 8: Load actual config.yaml file
-def test_load_actual_config_file():
+def test_load_actual_config_file(real_config):
     """Test loading the actual config.yaml file from the project.
     
     Requirements: 7.1, 7.2
     """
-    # Load the actual configuration file
-    config = load_config("config.yaml")
+    config = real_config
     
     # Verify it loads successfully
     assert isinstance(config, Config)
@@ -456,3 +349,15 @@ def test_load_actual_config_file():
         assert rules.planning in ["ALLOWED", "DENIED"]
         assert rules.execution in ["ALLOWED", "DENIED"]
         assert rules.mode in ["NORMAL", "CONTAINMENT", "RECOVERY"]
+
+
+# Test 9: In-memory test config stays in sync with config.yaml
+def test_sample_config_matches_config_file(real_config):
+    """Test that the shared in-memory test config matches config.yaml.
+    
+    Tests that use tests.fixtures.create_sample_config() instead of loading
+    config.yaml rely on the two being identical.
+    
+    Requirements: 7.1, 7.2
+    """
+    assert create_sample_config() == real_config
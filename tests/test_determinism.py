@@ -4,214 +4,192 @@ Feature: personal-decision-support-system, Property 8: Deterministic Behavior
 Validates: Requirements 6.2
 """
 
-from hypothesis import given, strategies as st, settings
+import os
+import random
+
+from hypothesis import given, strategies as st, settings, Phase
 
-from pl_dss.config import Config, ThresholdConfig, OverloadThresholds, RecoveryThresholds
 from pl_dss.evaluator import StateInputs, evaluate_state
 from pl_dss.rules import get_active_rules
 from pl_dss.recovery import check_recovery
 from pl_dss.main import run_system, format_output
 
+from tests.fixtures import create_sample_config
 
-def create_sample_config():
-    """Create a sample configuration for testing."""
-    from pl_dss.config import AuthorityRules
-    
-    overload = OverloadThresholds(
-        fixed_deadlines_14d=3,
-        active_high_load_domains=3,
-        avg_energy_score=2
-    )
-    recovery = RecoveryThresholds(
-        fixed_deadlines_14d=1,
-        active_high_load_domains=2,
-        avg_energy_score=4
-    )
-    thresholds = ThresholdConfig(overload=overload, recovery=recovery)
-    
-    downgrade_rules = {
-        "OVERLOADED": [
-            "No new commitments",
-            "Pause technical tool development",
-            "Creative work reduced to minimum viable expression",
-            "Administrative work: only non-delegable tasks"
-        ],
-        "STRESSED": [
-            "Warning: approaching overload",
-            "Discourage new projects",
-            "Suggest creating time buffers"
-        ]
-    }
-    
-    recovery_advice = [
-        "Deadlines have cleared",
-        "High-load domains have reduced",
-        "Energy levels have stabilized"
-    ]
-    
-    authority_derivation = {
-        "OVERLOADED": AuthorityRules(planning="DENIED", execution="DENIED", mode="CONTAINMENT"),
-        "STRESSED": AuthorityRules(planning="DENIED", execution="DENIED", mode="CONTAINMENT"),
-        "NORMAL": AuthorityRules(planning="ALLOWED", execution="DENIED", mode="NORMAL")
-    }
-    
-    return Config(
-        thresholds=thresholds,
-        downgrade_rules=downgrade_rules,
-        recovery_advice=recovery_advice,
-        authority_derivation=authority_derivation
-    )
-
-
-# Strategy for generating valid energy scores (3 integers between 1 and 5)
-energy_scores_strategy = st.lists(
-    st.integers(min_value=1, max_value=5),
-    min_size=3,
-    max_size=3
-)
 
-# Strategy for generating non-negative integers
-non_negative_int_strategy = st.integers(min_value=0, max_value=100)
+# Config is only read by the functions under test, so one instance is
+# shared by every example instead of being rebuilt per example
+SAMPLE_CONFIG = create_sample_config()
+
+# How many times each determinism property runs the code under test per
+# example. Two runs are enough to expose nondeterminism; raise it with
+# PLDSS_DETERMINISM_REPEATS for more thorough runs.
+DETERMINISM_REPEATS = max(2, int(os.environ.get("PLDSS_DETERMINISM_REPEATS", "2")))
 
-# Strategy for generating valid StateInputs
-state_inputs_strategy = st.builds(
-    StateInputs,
-    fixed_deadlines_14d=non_negative_int_strategy,
-    active_high_load_domains=non_negative_int_strategy,
-    energy_scores_last_3_days=energy_scores_strategy
+# The properties exercise pure functions, so a failure is not expected to need
+# shrinking. Derandomized generation with no shrink phase keeps runs fast and
+# repeatable, and skips the example database.
+determinism_settings = settings(
+    max_examples=100,
+    deadline=None,
+    derandomize=True,
+    phases=[Phase.explicit, Phase.generate],
 )
 
 
+# Counts drawn for deadlines and domains: everything around the thresholds
+# (3 and 2 for overload, 1 and 2 for recovery) plus a few large values
+COUNT_VALUES = list(range(0, 8)) + [10, 25, 50, 100]
+
+
+def build_state_inputs_pool(size=500, seed=0):
+    """Build a fixed, reproducible pool of valid StateInputs.
+    
+    Args:
+        size: Number of inputs in the pool
+        seed: Seed for the pool's random generator
+        
+    Returns:
+        List of StateInputs covering NORMAL, STRESSED and OVERLOADED inputs
+    """
+    rng = random.Random(seed)
+    return [
+        StateInputs(
+            fixed_deadlines_14d=rng.choice(COUNT_VALUES),
+            active_high_load_domains=rng.choice(COUNT_VALUES),
+            energy_scores_last_3_days=[rng.randint(1, 5) for _ in range(3)]
+        )
+        for _ in range(size)
+    ]
+
+
+# Strategy for drawing valid StateInputs from a pool built once at import.
+# The functions under test only read their inputs, so pooled objects are
+# safe to share between examples.
+state_inputs_strategy = st.sampled_from(build_state_inputs_pool())
+
+
 @given(inputs=state_inputs_strategy)
-@settings(max_examples=100)
+@determinism_settings
 def test_deterministic_state_evaluation(inputs):
     """Property 8: Deterministic Behavior - State evaluation.
     
-    For any valid inputs, running evaluate_state multiple times with the same
+    For any valid inputs, running evaluate_state repeatedly with the same
     inputs and configuration should produce identical results every time.
     
     Feature: personal-decision-support-system, Property 8: Deterministic Behavior
     Validates: Requirements 6.2
     """
-    config = create_sample_config()
+    config = SAMPLE_CONFIG
     
     # Run evaluation multiple times
-    result1 = evaluate_state(inputs, config)
-    result2 = evaluate_state(inputs, config)
-    result3 = evaluate_state(inputs, config)
+    results = [evaluate_state(inputs, config) for _ in range(DETERMINISM_REPEATS)]
     
     # All results should be identical
-    assert result1.state == result2.state == result3.state
-    assert result1.explanation == result2.explanation == result3.explanation
-    assert result1.conditions_met == result2.conditions_met == result3.conditions_met
+    for result in results[1:]:
+        assert result == results[0]
 
 
 @given(inputs=state_inputs_strategy)
-@settings(max_examples=100)
+@determinism_settings
 def test_deterministic_rule_engine(inputs):
     """Property 8: Deterministic Behavior - Rule engine.
     
-    For any valid inputs, running the rule engine multiple times with the same
+    For any valid inputs, running the rule engine repeatedly with the same
     state should produce identical results every time.
     
     Feature: personal-decision-support-system, Property 8: Deterministic Behavior
     Validates: Requirements 6.2
     """
-    config = create_sample_config()
+    config = SAMPLE_CONFIG
     
     # First get the state
     state_result = evaluate_state(inputs, config)
     
     # Run rule engine multiple times
-    rule_result1 = get_active_rules(state_result.state, config)
-    rule_result2 = get_active_rules(state_result.state, config)
-    rule_result3 = get_active_rules(state_result.state, config)
+    rule_results = [get_active_rules(state_result.state, config) for _ in range(DETERMINISM_REPEATS)]
     
     # All results should be identical
-    assert rule_result1.state == rule_result2.state == rule_result3.state
-    assert rule_result1.active_rules == rule_result2.active_rules == rule_result3.active_rules
+    for rule_result in rule_results[1:]:
+        assert rule_result == rule_results[0]
 
 
 @given(inputs=state_inputs_strategy)
-@settings(max_examples=100)
+@determinism_settings
 def test_deterministic_recovery_monitor(inputs):
     """Property 8: Deterministic Behavior - Recovery monitor.
     
-    For any valid inputs, running the recovery monitor multiple times with the
+    For any valid inputs, running the recovery monitor repeatedly with the
     same inputs should produce identical results every time.
     
     Feature: personal-decision-support-system, Property 8: Deterministic Behavior
     Validates: Requirements 6.2
     """
-    config = create_sample_config()
+    config = SAMPLE_CONFIG
     
     # First get the state
     state_result = evaluate_state(inputs, config)
     
     # Run recovery monitor multiple times
-    recovery_result1 = check_recovery(inputs, state_result.state, config)
-    recovery_result2 = check_recovery(inputs, state_result.state, config)
-    recovery_result3 = check_recovery(inputs, state_result.state, config)
+    recovery_results = [
+        check_recovery(inputs, state_result.state, config) for _ in range(DETERMINISM_REPEATS)
+    ]
     
     # All results should be identical
-    assert recovery_result1.can_recover == recovery_result2.can_recover == recovery_result3.can_recover
-    assert recovery_result1.explanation == recovery_result2.explanation == recovery_result3.explanation
-    assert recovery_result1.blocking_conditions == recovery_result2.blocking_conditions == recovery_result3.blocking_conditions
+    for recovery_result in recovery_results[1:]:
+        assert recovery_result == recovery_results[0]
 
 
 @given(inputs=state_inputs_strategy)
-@settings(max_examples=100)
+@determinism_settings
 def test_deterministic_complete_system(inputs):
     """Property 8: Deterministic Behavior - Complete system.
     
-    For any valid inputs, running the complete system multiple times with the
-    same inputs and configuration should produce identical output every time.
+    For any valid inputs, the complete system pipeline should produce the same
+    results as composing its components directly. Each component is checked
+    for determinism by the tests above, so this makes run_system deterministic
+    as well.
     
     Feature: personal-decision-support-system, Property 8: Deterministic Behavior
     Validates: Requirements 6.2
     """
-    config = create_sample_config()
+    config = SAMPLE_CONFIG
     
-    # Run complete system pipeline multiple times
-    state1, rules1, recovery1 = run_system(inputs, config)
-    state2, rules2, recovery2 = run_system(inputs, config)
-    state3, rules3, recovery3 = run_system(inputs, config)
+    # Run complete system pipeline once
+    state, rules, recovery = run_system(inputs, config)
     
-    # All state results should be identical
-    assert state1.state == state2.state == state3.state
-    assert state1.explanation == state2.explanation == state3.explanation
-    assert state1.conditions_met == state2.conditions_met == state3.conditions_met
+    # Compose the same pipeline from its components
+    expected_state = evaluate_state(inputs, config)
+    expected_rules = get_active_rules(expected_state.state, config)
+    expected_recovery = check_recovery(inputs, expected_state.state, config)
     
-    # All rule results should be identical
-    assert rules1.state == rules2.state == rules3.state
-    assert rules1.active_rules == rules2.active_rules == rules3.active_rules
-    
-    # All recovery results should be identical
-    assert recovery1.can_recover == recovery2.can_recover == recovery3.can_recover
-    assert recovery1.explanation == recovery2.explanation == recovery3.explanation
-    assert recovery1.blocking_conditions == recovery2.blocking_conditions == recovery3.blocking_conditions
+    # Pipeline results should match the composed results
+    assert state == expected_state
+    assert rules == expected_rules
+    assert recovery == expected_recovery
 
 
 @given(inputs=state_inputs_strategy)
-@settings(max_examples=100)
+@determinism_settings
 def test_deterministic_output_formatting(inputs):
     """Property 8: Deterministic Behavior - Output formatting.
     
-    For any valid inputs, formatting the output multiple times with the same
+    For any valid inputs, formatting the output repeatedly with the same
     results should produce identical text every time.
     
     Feature: personal-decision-support-system, Property 8: Deterministic Behavior
     Validates: Requirements 6.2
     """
-    config = create_sample_config()
+    config = SAMPLE_CONFIG
     
     # Run system once to get results
     state_result, rule_result, recovery_result = run_system(inputs, config)
     
     # Format output multiple times
-    output1 = format_output(state_result, rule_result, recovery_result)
-    output2 = format_output(state_result, rule_result, recovery_result)
-    output3 = format_output(state_result, rule_result, recovery_result)
+    outputs = [
+        format_output(state_result, rule_result, recovery_result) for _ in range(DETERMINISM_REPEATS)
+    ]
     
     # All outputs should be identical
-    assert output1 == output2 == output3
+    for output in outputs[1:]:
+        assert output == outputs[0]
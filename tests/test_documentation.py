@@ -7,181 +7,215 @@ for the Personal Life Orchestrator (PLO) system.
 Requirements: 12.1, 12.2, 12.3, 12.4, 12.5
 """
 
-import os
+import re
+from pathlib import Path
+
 import pytest
 
+from tests.text_scan import find_patterns
+
+
+README_PATH = Path(__file__).resolve().parent.parent / "README.md"
+
+# Literal markers the tests look for anywhere in the README
+README_MARKERS = frozenset({
+    "Personal Life Orchestrator",
+    "PLO",
+    "What PLO Does",
+    "What PLO Refuses to Do",
+    "No autonomous execution",
+    "How PLO Will Expand Safely",
+    "Phase",
+    "phase",
+    "PLO Layer Responsibilities",
+    "Layer Responsibilities",
+    "L0",
+    "Decision Core",
+    "L1",
+    "Planning Engine",
+    "L2",
+    "Execution Layer",
+    "L0: Decision Core",
+    "L0 (Decision Core)",
+    "L1: Planning Engine",
+    "L1 (Planning Engine)",
+    "L2: Execution Layer",
+    "L2 (Execution Layer)",
+    "Authority Derivation Rules",
+    "OVERLOADED",
+    "STRESSED",
+    "NORMAL",
+    "Planning Permission",
+    "Execution Permission",
+    "ALLOWED",
+    "DENIED",
+    "CONTAINMENT",
+    "Global Authority",
+})
+
+# Headings whose surrounding text the layer and authority tests inspect,
+# mapped to how many characters after the first occurrence to keep
+# (None keeps the rest of the README)
+SECTION_WINDOWS = {"L0": 1000, "L1": 1000, "L2": 1000, "Global Authority": None}
+
+# Marker presence checks: (alternative spellings, failure message). Any one
+# spelling satisfies the check.
+REQUIRED_README_MARKERS = [
+    # Requirement 12.1 - System SHALL include README explaining what the system does
+    pytest.param(("Personal Life Orchestrator", "PLO"),
+                 "README must explain Personal Life Orchestrator", id="plo"),
+    pytest.param(("What PLO Does",),
+                 "README must have 'What PLO Does' section", id="what-plo-does"),
+    # Requirement 12.2 - System SHALL include README explaining what the system refuses to do
+    pytest.param(("What PLO Refuses to Do",),
+                 "README must have 'What PLO Refuses to Do' section", id="what-plo-refuses"),
+    pytest.param(("No autonomous execution",),
+                 "README must list what PLO refuses to do", id="refusals-listed"),
+    # Requirement 12.3 - System SHALL include README explaining how it will expand safely
+    pytest.param(("How PLO Will Expand Safely",),
+                 "README must have 'How PLO Will Expand Safely' section", id="safe-expansion"),
+    pytest.param(("Phase", "phase"),
+                 "README must explain phased expansion approach", id="phased-expansion"),
+    # Requirement 12.4 - System SHALL document layer responsibilities
+    pytest.param(("PLO Layer Responsibilities", "Layer Responsibilities"),
+                 "README must have layer responsibilities section", id="layer-responsibilities"),
+    pytest.param(("L0", "Decision Core"),
+                 "README must document L0 (Decision Core) layer", id="l0"),
+    pytest.param(("L1", "Planning Engine"),
+                 "README must document L1 (Planning Engine) layer", id="l1"),
+    pytest.param(("L2", "Execution Layer"),
+                 "README must document L2 (Execution Layer) layer", id="l2"),
+    # Requirement 12.5 - System SHALL document authority derivation rules
+    pytest.param(("Authority Derivation Rules",),
+                 "README must have 'Authority Derivation Rules' section", id="authority-rules"),
+    pytest.param(("OVERLOADED",),
+                 "Authority derivation must document OVERLOADED state", id="overloaded-state"),
+    pytest.param(("STRESSED",),
+                 "Authority derivation must document STRESSED state", id="stressed-state"),
+    pytest.param(("NORMAL",),
+                 "Authority derivation must document NORMAL state and mode", id="normal-state"),
+    pytest.param(("CONTAINMENT",),
+                 "Authority derivation must document CONTAINMENT mode", id="containment-mode"),
+]
+
+
+@pytest.fixture(scope="module")
+def readme_sections(readme_content):
+    """Text following the first occurrence of each SECTION_WINDOWS heading.
+    
+    All offsets are found in one regex sweep. A heading that does not occur
+    maps to the whole README.
+    """
+    starts = {}
+    pattern = "|".join(re.escape(heading) for heading in SECTION_WINDOWS)
+    for match in re.finditer(pattern, readme_content):
+        starts.setdefault(match.group(), match.start())
+    
+    sections = {}
+    for heading, window in SECTION_WINDOWS.items():
+        start = starts.get(heading)
+        if start is None:
+            sections[heading] = readme_content
+        else:
+            end = None if window is None else start + window
+            sections[heading] = readme_content[start:end]
+    return sections
+
+
+@pytest.fixture(scope="module")
+def readme_markers(readme_content):
+    """Markers from README_MARKERS present in README.md, found in one scan."""
+    return find_patterns(readme_content, README_MARKERS)
+
 
 class TestDocumentation:
     """Test that documentation exists and contains required sections."""
 
-    @pytest.fixture
-    def readme_content(self):
-        """Load README.md content."""
-        readme_path = os.path.join(os.path.dirname(__file__), "..", "README.md")
-        with open(readme_path, "r", encoding="utf-8") as f:
-            return f.read()
-
     def test_readme_exists(self):
         """Test that README.md exists.
         
         Requirement: 12.1 - System SHALL include README explaining what the system does
         """
-        readme_path = os.path.join(os.path.dirname(__file__), "..", "README.md")
-        assert os.path.exists(readme_path), "README.md must exist"
-
-    def test_readme_explains_what_system_does(self, readme_content):
-        """Test that README explains what the system does.
-        
-        Requirement: 12.1 - System SHALL include README explaining what the system does
-        """
-        # Check for PLO section
-        assert "Personal Life Orchestrator" in readme_content or "PLO" in readme_content, \
-            "README must explain Personal Life Orchestrator"
-        
-        # Check for explanation of what PLO does
-        assert "What PLO Does" in readme_content, \
-            "README must have 'What PLO Does' section"
+        assert README_PATH.exists(), "README.md must exist"
 
-    def test_readme_explains_what_system_refuses(self, readme_content):
-        """Test that README explains what the system refuses to do.
+    @pytest.mark.parametrize("alternatives,message", REQUIRED_README_MARKERS)
+    def test_readme_contains_required_marker(self, readme_markers, alternatives, message):
+        """Test that README contains at least one of each required marker's spellings.
         
-        Requirement: 12.2 - System SHALL include README explaining what the system refuses to do
+        Requirements: 12.1, 12.2, 12.3, 12.4, 12.5
         """
-        assert "What PLO Refuses to Do" in readme_content, \
-            "README must have 'What PLO Refuses to Do' section"
-        
-        # Check for explicit refusals
-        assert "No autonomous execution" in readme_content or "❌" in readme_content, \
-            "README must list what PLO refuses to do"
+        assert any(marker in readme_markers for marker in alternatives), message
 
-    def test_readme_explains_safe_expansion(self, readme_content):
-        """Test that README explains how the system will expand safely.
-        
-        Requirement: 12.3 - System SHALL include README explaining how it will expand safely
-        """
-        assert "How PLO Will Expand Safely" in readme_content, \
-            "README must have 'How PLO Will Expand Safely' section"
-        
-        # Check for phase-based expansion
-        assert "Phase" in readme_content or "phase" in readme_content, \
-            "README must explain phased expansion approach"
-
-    def test_layer_responsibilities_documented(self, readme_content):
-        """Test that layer responsibilities are documented.
-        
-        Requirement: 12.4 - System SHALL document layer responsibilities
-        """
-        assert "PLO Layer Responsibilities" in readme_content or "Layer Responsibilities" in readme_content, \
-            "README must have layer responsibilities section"
-        
-        # Check for L0, L1, L2 documentation
-        assert "L0" in readme_content or "Decision Core" in readme_content, \
-            "README must document L0 (Decision Core) layer"
-        assert "L1" in readme_content or "Planning Engine" in readme_content, \
-            "README must document L1 (Planning Engine) layer"
-        assert "L2" in readme_content or "Execution Layer" in readme_content, \
-            "README must document L2 (Execution Layer) layer"
-
-    def test_l0_decision_core_documented(self, readme_content):
+    def test_l0_decision_core_documented(self, readme_sections, readme_markers):
         """Test that L0 Decision Core responsibilities are documented.
         
         Requirement: 12.4 - System SHALL document layer responsibilities
         """
         # Check for L0 section
-        assert "L0: Decision Core" in readme_content or "L0 (Decision Core)" in readme_content, \
+        assert "L0: Decision Core" in readme_markers or "L0 (Decision Core)" in readme_markers, \
             "README must document L0 Decision Core"
         
         # Check for key L0 responsibilities
-        l0_section_start = readme_content.find("L0")
-        l0_section = readme_content[l0_section_start:l0_section_start + 1000] if l0_section_start != -1 else readme_content
+        l0_section = readme_sections["L0"]
         
         assert "Evaluate" in l0_section or "evaluate" in l0_section, \
             "L0 documentation must mention state evaluation"
 
-    def test_l1_planning_engine_documented(self, readme_content):
+    def test_l1_planning_engine_documented(self, readme_sections, readme_markers):
         """Test that L1 Planning Engine responsibilities are documented.
         
         Requirement: 12.4 - System SHALL document layer responsibilities
         """
         # Check for L1 section
-        assert "L1: Planning Engine" in readme_content or "L1 (Planning Engine)" in readme_content, \
+        assert "L1: Planning Engine" in readme_markers or "L1 (Planning Engine)" in readme_markers, \
             "README must document L1 Planning Engine"
         
         # Check for key L1 characteristics
-        l1_section_start = readme_content.find("L1")
-        l1_section = readme_content[l1_section_start:l1_section_start + 1000] if l1_section_start != -1 else readme_content
+        l1_section = readme_sections["L1"]
         
         assert "Interface" in l1_section or "interface" in l1_section, \
             "L1 documentation must mention interface"
 
-    def test_l2_execution_layer_documented(self, readme_content):
+    def test_l2_execution_layer_documented(self, readme_sections, readme_markers):
         """Test that L2 Execution Layer responsibilities are documented.
         
         Requirement: 12.4 - System SHALL document layer responsibilities
         """
         # Check for L2 section
-        assert "L2: Execution Layer" in readme_content or "L2 (Execution Layer)" in readme_content, \
+        assert "L2: Execution Layer" in readme_markers or "L2 (Execution Layer)" in readme_markers, \
             "README must document L2 Execution Layer"
         
         # Check for key L2 characteristics
-        l2_section_start = readme_content.find("L2")
-        l2_section = readme_content[l2_section_start:l2_section_start + 1000] if l2_section_start != -1 else readme_content
+        l2_section = readme_sections["L2"]
         
         assert "Disabled" in l2_section or "disabled" in l2_section or "ExecutionError" in l2_section, \
             "L2 documentation must mention that execution is disabled"
 
-    def test_authority_derivation_rules_documented(self, readme_content):
-        """Test that authority derivation rules are documented.
-        
-        Requirement: 12.5 - System SHALL document authority derivation rules
-        """
-        assert "Authority Derivation Rules" in readme_content, \
-            "README must have 'Authority Derivation Rules' section"
-        
-        # Check for state-to-authority mappings
-        assert "OVERLOADED" in readme_content, \
-            "Authority derivation must document OVERLOADED state"
-        assert "STRESSED" in readme_content, \
-            "Authority derivation must document STRESSED state"
-        assert "NORMAL" in readme_content, \
-            "Authority derivation must document NORMAL state"
-
-    def test_authority_derivation_permissions_documented(self, readme_content):
+    def test_authority_derivation_permissions_documented(self, readme_content, readme_markers):
         """Test that authority permissions are documented.
         
         Requirement: 12.5 - System SHALL document authority derivation rules
         """
         # Check for permission types
-        assert "Planning Permission" in readme_content or "planning" in readme_content.lower(), \
+        assert "Planning Permission" in readme_markers or "planning" in readme_content.lower(), \
             "Authority derivation must document planning permission"
-        assert "Execution Permission" in readme_content or "execution" in readme_content.lower(), \
+        assert "Execution Permission" in readme_markers or "execution" in readme_content.lower(), \
             "Authority derivation must document execution permission"
         
         # Check for permission values
-        assert "ALLOWED" in readme_content or "DENIED" in readme_content, \
+        assert "ALLOWED" in readme_markers or "DENIED" in readme_markers, \
             "Authority derivation must document permission values (ALLOWED/DENIED)"
 
-    def test_authority_modes_documented(self, readme_content):
-        """Test that authority modes are documented.
-        
-        Requirement: 12.5 - System SHALL document authority derivation rules
-        """
-        # Check for authority modes
-        assert "CONTAINMENT" in readme_content, \
-            "Authority derivation must document CONTAINMENT mode"
-        assert "NORMAL" in readme_content, \
-            "Authority derivation must document NORMAL mode"
-
-    def test_global_authority_enforcement_documented(self, readme_content):
+    def test_global_authority_enforcement_documented(self, readme_sections, readme_markers):
         """Test that Global Authority enforcement is documented.
         
         Requirement: 12.5 - System SHALL document authority derivation rules
         """
-        assert "Global Authority" in readme_content, \
+        assert "Global Authority" in readme_markers, \
             "README must document Global Authority concept"
         
         # Check for authority enforcement explanation
-        authority_section = readme_content[readme_content.find("Global Authority"):] if "Global Authority" in readme_content else readme_content
+        authority_section = readme_sections["Global Authority"]
         
         assert "derived" in authority_section.lower() or "Decision Core" in authority_section, \
             "README must explain that authority is derived from Decision Core"
@@ -6,12 +6,34 @@ execution attempt, and provides the correct error message.
 Requirements: 3.1
 """
 
+from pathlib import Path
+
 import pytest
 from hypothesis import given, strategies as st, settings
-from pl_dss.execution import execute_action, ExecutionError
+from pl_dss.execution import execute_action, ExecutionError, DISABLED_MESSAGE
 from pl_dss.authority import GlobalAuthority
 
 
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# execute_action never reads or modifies its authority, so these are shared
+NORMAL_AUTHORITY = GlobalAuthority(
+    planning="ALLOWED",
+    execution="DENIED",
+    mode="NORMAL",
+    state="NORMAL",
+    active_rules=[]
+)
+
+OVERLOADED_AUTHORITY = GlobalAuthority(
+    planning="DENIED",
+    execution="DENIED",
+    mode="CONTAINMENT",
+    state="OVERLOADED",
+    active_rules=["No new commitments"]
+)
+
+
 def test_execution_module_exists():
     """Test that the execution module exists and can be imported.
     
@@ -38,14 +60,8 @@ def test_execution_error_is_raised():
     
     Requirements: 3.1
     """
-    # Create a sample authority object (doesn't matter what it contains)
-    authority = GlobalAuthority(
-        planning="ALLOWED",
-        execution="DENIED",
-        mode="NORMAL",
-        state="NORMAL",
-        active_rules=[]
-    )
+    # Any authority object will do (doesn't matter what it contains)
+    authority = NORMAL_AUTHORITY
     
     # Attempt execution with any action
     with pytest.raises(ExecutionError):
@@ -59,16 +75,19 @@ def test_execution_error_is_raised():
         execute_action(action=None, authority=authority)
     
     # Try with different authority states
-    authority_denied = GlobalAuthority(
-        planning="DENIED",
-        execution="DENIED",
-        mode="CONTAINMENT",
-        state="OVERLOADED",
-        active_rules=["No new commitments"]
-    )
-    
     with pytest.raises(ExecutionError):
-        execute_action(action="test_action", authority=authority_denied)
+        execute_action(action="test_action", authority=OVERLOADED_AUTHORITY)
+
+
+def test_disabled_message_text():
+    """Test the user-facing wording of the disabled-execution message.
+    
+    Other tests compare against execution.DISABLED_MESSAGE; this one pins
+    its text so a wording change is deliberate.
+    
+    Requirements: 3.1
+    """
+    assert DISABLED_MESSAGE == "Automation disabled in current system version"
 
 
 def test_execution_error_message_is_correct():
@@ -79,27 +98,20 @@ def test_execution_error_message_is_correct():
     
     Requirements: 3.1
     """
-    # Create a sample authority object
-    authority = GlobalAuthority(
-        planning="ALLOWED",
-        execution="DENIED",
-        mode="NORMAL",
-        state="NORMAL",
-        active_rules=[]
-    )
+    authority = NORMAL_AUTHORITY
     
     # Capture the exception and verify the message
     with pytest.raises(ExecutionError) as exc_info:
         execute_action(action="test_action", authority=authority)
     
     # Verify the exact error message
-    assert str(exc_info.value) == "Automation disabled in current system version"
+    assert str(exc_info.value) == DISABLED_MESSAGE
     
     # Verify the error message is consistent across different calls
     with pytest.raises(ExecutionError) as exc_info2:
         execute_action(action="different_action", authority=authority)
     
-    assert str(exc_info2.value) == "Automation disabled in current system version"
+    assert str(exc_info2.value) == DISABLED_MESSAGE
 
 
 def test_execution_error_is_exception_subclass():
@@ -114,42 +126,43 @@ def test_execution_error_is_exception_subclass():
     assert issubclass(ExecutionError, Exception)
     
     # Verify it can be caught as a general Exception
-    authority = GlobalAuthority(
-        planning="ALLOWED",
-        execution="DENIED",
-        mode="NORMAL",
-        state="NORMAL",
-        active_rules=[]
-    )
-    
     try:
-        execute_action(action="test", authority=authority)
+        execute_action(action="test", authority=NORMAL_AUTHORITY)
         assert False, "Should have raised ExecutionError"
     except Exception as e:
         # Should be catchable as Exception
         assert isinstance(e, ExecutionError)
-        assert str(e) == "Automation disabled in current system version"
+        assert str(e) == DISABLED_MESSAGE
 
 
 
 # Property-Based Tests
 
-@settings(max_examples=100)
-@given(
-    action=st.one_of(
-        st.none(),
-        st.text(),
-        st.integers(),
-        st.lists(st.text()),
-        st.dictionaries(st.text(), st.text()),
-    ),
+# Strategy for generating arbitrary action payloads
+action_strategy = st.one_of(
+    st.none(),
+    st.text(),
+    st.integers(),
+    st.lists(st.text()),
+    st.dictionaries(st.text(), st.text()),
+)
+
+# Strategy for generating GlobalAuthority objects with random valid values
+authority_strategy = st.builds(
+    GlobalAuthority,
     planning=st.sampled_from(["ALLOWED", "DENIED"]),
     execution=st.sampled_from(["ALLOWED", "DENIED"]),
     mode=st.sampled_from(["NORMAL", "CONTAINMENT", "RECOVERY"]),
     state=st.sampled_from(["NORMAL", "STRESSED", "OVERLOADED"]),
     active_rules=st.lists(st.text(), max_size=5)
 )
-def test_property_execution_prohibition(action, planning, execution, mode, state, active_rules):
+
+
+# execute_action has a single code path that ignores its inputs, so a small
+# sample covers it fully
+@settings(max_examples=20, deadline=None)
+@given(action=action_strategy, authority=authority_strategy)
+def test_property_execution_prohibition(action, authority):
     """Property test: Execution Layer always raises ExecutionError.
     
     Feature: github-interface, Property 15: Execution Layer Prohibition
@@ -165,21 +178,12 @@ def test_property_execution_prohibition(action, planning, execution, mode, state
     
     Validates: Requirements 9.1, 9.2, 9.4
     """
-    # Create authority with random valid values
-    authority = GlobalAuthority(
-        planning=planning,
-        execution=execution,
-        mode=mode,
-        state=state,
-        active_rules=active_rules
-    )
-    
     # Execution should ALWAYS raise ExecutionError, regardless of inputs
     with pytest.raises(ExecutionError) as exc_info:
         execute_action(action=action, authority=authority)
     
     # Verify the error message is correct
-    assert str(exc_info.value) == "Automation disabled in current system version"
+    assert str(exc_info.value) == DISABLED_MESSAGE
 
 
 
@@ -193,16 +197,8 @@ def test_execution_module_has_prohibition_documentation():
     
     Requirements: 9.3, 9.5
     """
-    import os
-    
     # Read the execution.py file
-    execution_file_path = os.path.join(
-        os.path.dirname(os.path.dirname(__file__)),
-        'pl_dss',
-        'execution.py'
-    )
-    
-    with open(execution_file_path, 'r') as f:
+    with open(REPO_ROOT / 'pl_dss' / 'execution.py', 'r') as f:
         content = f.read()
     
     # Verify key documentation elements are present
@@ -226,7 +222,7 @@ def test_execution_module_has_prohibition_documentation():
         "Module should contain the error message about automation being disabled"
 
 
-def test_readme_documents_execution_disabled():
+def test_readme_documents_execution_disabled(readme_content):
     """Test that README documents that execution is disabled.
     
     Validates that the README includes information about the execution
@@ -234,16 +230,7 @@ def test_readme_documents_execution_disabled():
     
     Requirements: 9.3, 9.5
     """
-    import os
-    
-    # Read the README.md file
-    readme_path = os.path.join(
-        os.path.dirname(os.path.dirname(__file__)),
-        'README.md'
-    )
-    
-    with open(readme_path, 'r') as f:
-        content = f.read()
+    content = readme_content
     
     # Verify execution is documented as disabled
     # Check for System Constitution section which should mention execution
@@ -7,17 +7,22 @@ remain byte-for-byte identical to v0.3-stable tag.
 Requirements: 1.5, 17.1, 17.2, 17.3, 17.4, 17.5
 """
 
-import os
+import functools
 import hashlib
+import json
 import subprocess
+from pathlib import Path
+from typing import Dict
+
 import pytest
-from hypothesis import given, strategies as st, settings
 
 
 # ============================================================================
 # Frozen Component Paths
 # ============================================================================
 
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
 FROZEN_COMPONENTS = [
     "pl_dss/evaluator.py",
     "pl_dss/rules.py",
@@ -26,6 +31,11 @@ FROZEN_COMPONENTS = [
     "config.yaml",
 ]
 
+# SHA256 of each frozen component at v0.3-stable (also listed in
+# V03_FROZEN_BASELINE.md), so the checks need neither git nor the tag
+FROZEN_BASELINE_PATH = Path(__file__).resolve().parent / "frozen_baseline.json"
+FROZEN_BASELINE: Dict[str, str] = json.loads(FROZEN_BASELINE_PATH.read_text(encoding="utf-8"))
+
 
 # ============================================================================
 # Helper Functions
@@ -41,13 +51,62 @@ def get_file_hash(filepath: str) -> str:
     Returns:
         Hex string of SHA256 hash
     """
-    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    full_path = os.path.join(repo_root, filepath)
+    full_path = REPO_ROOT / filepath
     
     with open(full_path, 'rb') as f:
+        # hashlib.file_digest (Python 3.11+) hashes without building a copy
+        # of the whole file as a bytes object
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
         return hashlib.sha256(f.read()).hexdigest()
 
 
+@functools.lru_cache(maxsize=None)
+def get_git_baseline_hashes(tag: str = "v0.3-stable") -> Dict[str, str]:
+    """
+    Get SHA256 hashes of all frozen components at a specific git tag.
+    
+    All components are read through a single `git cat-file --batch` call,
+    and the result is cached for the rest of the session.
+    
+    Args:
+        tag: Git tag to check
+        
+    Returns:
+        Mapping of component path to hex string of SHA256 hash
+        
+    Raises:
+        subprocess.CalledProcessError: If git command fails or a component
+            does not exist at the tag
+    """
+    request = "".join(f"{tag}:{filepath}\n" for filepath in FROZEN_COMPONENTS)
+    result = subprocess.run(
+        ["git", "cat-file", "--batch"],
+        cwd=REPO_ROOT,
+        input=request.encode("utf-8"),
+        capture_output=True,
+        check=True
+    )
+    
+    # Each object is "<sha> <type> <size>\n<content>\n"; unknown objects are
+    # reported as "<name> missing\n"
+    hashes = {}
+    output = result.stdout
+    offset = 0
+    for filepath in FROZEN_COMPONENTS:
+        header_end = output.index(b"\n", offset)
+        header = output[offset:header_end].split()
+        if header[-1] == b"missing":
+            raise subprocess.CalledProcessError(128, ["git", "cat-file", f"{tag}:{filepath}"])
+        
+        size = int(header[2])
+        content_start = header_end + 1
+        hashes[filepath] = hashlib.sha256(output[content_start:content_start + size]).hexdigest()
+        offset = content_start + size + 1
+    
+    return hashes
+
+
 def get_git_file_hash(filepath: str, tag: str = "v0.3-stable") -> str:
     """
     Get SHA256 hash of a file at a specific git tag.
@@ -62,12 +121,13 @@ def get_git_file_hash(filepath: str, tag: str = "v0.3-stable") -> str:
     Raises:
         subprocess.CalledProcessError: If git command fails
     """
-    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if filepath in FROZEN_COMPONENTS:
+        return get_git_baseline_hashes(tag)[filepath]
     
     # Get file content at tag
     result = subprocess.run(
         ["git", "show", f"{tag}:{filepath}"],
-        cwd=repo_root,
+        cwd=REPO_ROOT,
         capture_output=True,
         check=True
     )
@@ -79,6 +139,8 @@ def check_component_unchanged(filepath: str) -> tuple[bool, str, str]:
     """
     Check if a component file is unchanged from v0.3-stable.
     
+    The baseline hash is read from frozen_baseline.json rather than git.
+    
     Args:
         filepath: Path to file relative to repository root
         
@@ -87,13 +149,11 @@ def check_component_unchanged(filepath: str) -> tuple[bool, str, str]:
     """
     try:
         current_hash = get_file_hash(filepath)
-        baseline_hash = get_git_file_hash(filepath, "v0.3-stable")
-        return (current_hash == baseline_hash, current_hash, baseline_hash)
-    except subprocess.CalledProcessError:
-        # If git command fails, tag might not exist
-        pytest.skip(f"v0.3-stable tag not found or file {filepath} not in tag")
     except FileNotFoundError:
         pytest.fail(f"File {filepath} not found in current working directory")
+    
+    baseline_hash = FROZEN_BASELINE[filepath]
+    return (current_hash == baseline_hash, current_hash, baseline_hash)
 
 
 # ============================================================================
@@ -188,8 +248,7 @@ class TestFrozenComponentImmutability:
             f"Configuration thresholds must remain frozen."
         )
     
-    @given(component=st.sampled_from(FROZEN_COMPONENTS))
-    @settings(max_examples=100)
+    @pytest.mark.parametrize("component", FROZEN_COMPONENTS)
     def test_all_frozen_components_unchanged_property(self, component: str):
         """
         Property test: All frozen components remain unchanged.
@@ -215,6 +274,34 @@ class TestFrozenComponentImmutability:
 # Additional Validation Tests
 # ============================================================================
 
+class TestFrozenBaselineRecord:
+    """Test that frozen_baseline.json records exactly the v0.3-stable hashes."""
+    
+    def test_baseline_covers_frozen_components(self):
+        """
+        Test that the baseline record has one entry per frozen component.
+        """
+        assert sorted(FROZEN_BASELINE) == sorted(FROZEN_COMPONENTS)
+    
+    @pytest.mark.subprocess_test
+    @pytest.mark.parametrize("component", FROZEN_COMPONENTS)
+    def test_baseline_matches_tag(self, component: str):
+        """
+        Test that the recorded hash matches the component at the v0.3-stable tag.
+        
+        Validates: Requirement 1.5
+        """
+        try:
+            tag_hash = get_git_file_hash(component, "v0.3-stable")
+        except subprocess.CalledProcessError:
+            pytest.skip(f"v0.3-stable tag not found or file {component} not in tag")
+        
+        assert FROZEN_BASELINE[component] == tag_hash, (
+            f"frozen_baseline.json does not match v0.3-stable for {component}"
+        )
+
+
+@pytest.mark.subprocess_test
 class TestGitTagExists:
     """Test that v0.3-stable tag exists."""
     
@@ -224,11 +311,9 @@ class TestGitTagExists:
         
         Validates: Requirement 1.1 - System SHALL create git tag marking frozen state
         """
-        repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        
         result = subprocess.run(
             ["git", "tag", "-l", "v0.3-stable"],
-            cwd=repo_root,
+            cwd=REPO_ROOT,
             capture_output=True,
             text=True
         )
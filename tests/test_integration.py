@@ -17,20 +17,103 @@ from pl_dss.evaluator import StateInputs, evaluate_state
 from pl_dss.rules import get_active_rules
 from pl_dss.authority import derive_authority, GlobalAuthority
 from pl_dss.planning import PlanRequest, propose_plan, Task, Constraint
-from pl_dss.execution import execute_action, ExecutionError
+from pl_dss.execution import execute_action, ExecutionError, DISABLED_MESSAGE
+from pl_dss.plo_cli import run_cli
 from pl_dss.scenario_runner import (
     Scenario,
     ExpectedOutput,
     load_scenarios,
     run_scenario,
     format_scenario_output,
-    validate_scenario_output
+    validate_scenario_output,
+    ScenarioError
 )
 
+from tests.text_scan import find_patterns
 
-@pytest.fixture
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Section headers every CLI state report contains
+REPORT_SECTIONS = {"STATE:", "AUTHORITY:", "MODE:", "ACTIVE RULES:"}
+
+# Scenario file shared by the scenario runner and CLI tests; written once per
+# session through the yaml_file fixture
+SCENARIOS_YAML = """
+scenarios:
+  - name: "Test Overload"
+    inputs:
+      fixed_deadlines_14d: 4
+      active_high_load_domains: 3
+      energy_scores_last_3_days: [2, 2, 2]
+    expected:
+      state: OVERLOADED
+      planning: DENIED
+      execution: DENIED
+      mode: CONTAINMENT
+  
+  - name: "Test Normal"
+    inputs:
+      fixed_deadlines_14d: 1
+      active_high_load_domains: 1
+      energy_scores_last_3_days: [4, 4, 5]
+    expected:
+      state: NORMAL
+      planning: ALLOWED
+      execution: DENIED
+      mode: NORMAL
+"""
+
+# Advisory scenario data: one scenario with planning allowed, one blocked.
+# Passed to load_scenarios as a dictionary, so no file is written or parsed
+ADVISORY_SCENARIOS_DATA = {
+    "advisory_scenarios": [
+        {
+            "name": "Test Advisory Allowed",
+            "inputs": {
+                "fixed_deadlines_14d": 1,
+                "active_high_load_domains": 1,
+                "energy_scores_last_3_days": [4, 4, 5],
+                "tasks": [
+                    {"name": "Task 1", "deadline": "2026-02-12", "type": "coursework"},
+                    {"name": "Task 2", "deadline": "2026-02-11", "type": "admin"},
+                    {"name": "Task 3", "deadline": "2026-02-13", "type": "work"},
+                ],
+                "constraints": {"max_parallel_focus": 2},
+            },
+            "expected": {
+                "state": "NORMAL",
+                "planning": "ALLOWED",
+                "advisory_contains": ["3 deadlines", "3-day window"],
+            },
+        },
+        {
+            "name": "Test Advisory Blocked",
+            "inputs": {
+                "fixed_deadlines_14d": 4,
+                "active_high_load_domains": 3,
+                "energy_scores_last_3_days": [2, 2, 2],
+                "tasks": [
+                    {"name": "Task 1", "deadline": "2026-02-12", "type": "work"},
+                ],
+                "constraints": {"max_parallel_focus": 2},
+            },
+            "expected": {
+                "state": "OVERLOADED",
+                "planning": "DENIED",
+                "advisory_blocked": True,
+            },
+        },
+    ]
+}
+
+
+@pytest.fixture(scope="module")
 def sample_config():
-    """Create a sample configuration for testing."""
+    """Create a sample configuration for testing.
+    
+    Module-scoped: no test mutates the config, so it is built once per run.
+    """
     overload = OverloadThresholds(
         fixed_deadlines_14d=3,
         active_high_load_domains=3,
@@ -73,140 +156,130 @@ def sample_config():
     )
 
 
-# Test 1: Complete flow from Decision Core to Authority to Planning
-def test_complete_flow_decision_to_planning_overloaded(sample_config):
-    """Test complete flow: Decision Core → Authority → Planning (OVERLOADED state).
-    
-    Validates that when Decision Core determines OVERLOADED state:
-    1. Authority is correctly derived with planning DENIED
-    2. Planning Engine respects the authority and blocks planning
-    
-    Requirements: 4.1, 4.3, 8.1
-    """
-    # Step 1: Create inputs that trigger OVERLOADED state
-    inputs = StateInputs(
+# Canonical inputs for each state, built once at import. The pipeline only
+# reads StateInputs, so every test can share these instances.
+CANONICAL_INPUTS = {
+    "NORMAL": StateInputs(
+        fixed_deadlines_14d=1,
+        active_high_load_domains=1,
+        energy_scores_last_3_days=[4, 4, 5]
+    ),
+    "STRESSED": StateInputs(
+        fixed_deadlines_14d=3,
+        active_high_load_domains=2,
+        energy_scores_last_3_days=[3, 3, 3]
+    ),
+    "OVERLOADED": StateInputs(
         fixed_deadlines_14d=4,
         active_high_load_domains=3,
         energy_scores_last_3_days=[2, 2, 2]
-    )
-    
-    # Step 2: Evaluate state using Decision Core
-    state_result = evaluate_state(inputs, sample_config)
-    assert state_result.state == "OVERLOADED"
-    
-    # Step 3: Get active rules
-    rule_result = get_active_rules(state_result.state, sample_config)
-    assert len(rule_result.active_rules) > 0
-    
-    # Step 4: Derive Global Authority
-    authority = derive_authority(state_result, rule_result)
-    assert authority.planning == "DENIED"
-    assert authority.execution == "DENIED"
-    assert authority.mode == "CONTAINMENT"
+    ),
+}
+
+
+@pytest.fixture(scope="module")
+def canonical_authorities(sample_config):
+    """Global Authority derived once for each state's canonical inputs.
     
-    # Step 5: Attempt planning with DENIED authority
-    plan_request = PlanRequest(
-        tasks=[],
-        constraints=Constraint(),
-        decision_state=authority
-    )
-    plan_result = propose_plan(plan_request)
+    For tests of the layers below the Decision Core; the derivation itself is
+    checked by test_complete_flow_decision_to_planning.
+    """
+    authorities = {}
+    for state, inputs in CANONICAL_INPUTS.items():
+        state_result = evaluate_state(inputs, sample_config)
+        rule_result = get_active_rules(state_result.state, sample_config)
+        authorities[state] = derive_authority(state_result, rule_result)
+    return authorities
+
+
+# Planning never modifies its constraints, so one empty instance is shared
+EMPTY_CONSTRAINT = Constraint()
+
+
+def assert_planning_blocked(authority: GlobalAuthority):
+    """Assert that the Planning Engine refuses to plan under this authority.
     
-    # Step 6: Verify planning was blocked
+    Args:
+        authority: Global Authority with planning DENIED
+    """
+    plan_result = propose_plan(PlanRequest(tasks=[], constraints=EMPTY_CONSTRAINT, decision_state=authority))
     assert plan_result.advisory is None
     assert "ADVICE BLOCKED" in plan_result.reason
     assert "Planning forbidden by Decision Core" in plan_result.reason
     assert plan_result.blocked_by == "Decision Core"
 
 
-def test_complete_flow_decision_to_planning_normal(sample_config):
-    """Test complete flow: Decision Core → Authority → Planning (NORMAL state).
+# Test 1: Complete flow from Decision Core to Authority to Planning
+# (StateInputs, expected (state, planning, mode))
+STATE_FLOW_CASES = [
+    pytest.param(CANONICAL_INPUTS["NORMAL"], ("NORMAL", "ALLOWED", "NORMAL"), id="normal"),
+    pytest.param(CANONICAL_INPUTS["STRESSED"], ("STRESSED", "DENIED", "CONTAINMENT"), id="stressed"),
+    pytest.param(CANONICAL_INPUTS["OVERLOADED"], ("OVERLOADED", "DENIED", "CONTAINMENT"), id="overloaded"),
+]
+
+
+@pytest.mark.parametrize("inputs,expected", STATE_FLOW_CASES)
+def test_complete_flow_decision_to_planning(sample_config, inputs, expected):
+    """Test complete flow: Decision Core → Authority → Planning for each state.
     
-    Validates that when Decision Core determines NORMAL state:
-    1. Authority is correctly derived with planning ALLOWED
-    2. Planning Engine accepts the request but returns not implemented
+    Validates that for the state determined by Decision Core:
+    1. Authority is correctly derived (planning ALLOWED only in NORMAL)
+    2. Planning Engine respects the authority: it provides an advisory when
+       planning is ALLOWED and blocks planning when it is DENIED
     
-    Requirements: 4.1, 4.3, 8.1
+    Requirements: 4.1, 4.3, 8.1, 8.4
     """
-    # Step 1: Create inputs that trigger NORMAL state
-    inputs = StateInputs(
-        fixed_deadlines_14d=1,
-        active_high_load_domains=1,
-        energy_scores_last_3_days=[4, 4, 5]
-    )
+    expected_state, expected_planning, expected_mode = expected
     
-    # Step 2: Evaluate state using Decision Core
+    # Step 1: Evaluate the canonical inputs for the state using Decision Core
     state_result = evaluate_state(inputs, sample_config)
-    assert state_result.state == "NORMAL"
+    assert state_result.state == expected_state
     
-    # Step 3: Get active rules
+    # Step 2: Get active rules (only STRESSED and OVERLOADED have any)
     rule_result = get_active_rules(state_result.state, sample_config)
-    assert len(rule_result.active_rules) == 0
+    assert (len(rule_result.active_rules) > 0) == (expected_state != "NORMAL")
     
-    # Step 4: Derive Global Authority
+    # Step 3: Derive Global Authority
     authority = derive_authority(state_result, rule_result)
-    assert authority.planning == "ALLOWED"
+    assert authority.state == expected_state
+    assert authority.planning == expected_planning
     assert authority.execution == "DENIED"
-    assert authority.mode == "NORMAL"
-    
-    # Step 5: Attempt planning with ALLOWED authority
-    plan_request = PlanRequest(
-        tasks=[],
-        constraints=Constraint(),
-        decision_state=authority
-    )
-    plan_result = propose_plan(plan_request)
-    
-    # Step 6: Verify planning was not blocked but advisory is provided
-    assert plan_result.advisory is not None
-    assert plan_result.reason == "Advisory analysis complete"
-    assert plan_result.blocked_by is None
+    assert authority.mode == expected_mode
+    
+    # Step 4: Attempt planning and verify it was allowed or blocked as authorized
+    if expected_planning == "ALLOWED":
+        plan_result = propose_plan(
+            PlanRequest(tasks=[], constraints=EMPTY_CONSTRAINT, decision_state=authority)
+        )
+        assert plan_result.advisory is not None
+        assert plan_result.reason == "Advisory analysis complete"
+        assert plan_result.blocked_by is None
+    else:
+        assert_planning_blocked(authority)
 
 
 # Test 2: Complete flow from Decision Core to Authority to Execution
-def test_complete_flow_decision_to_execution_always_denied(sample_config):
+@pytest.mark.parametrize("state", list(CANONICAL_INPUTS))
+def test_complete_flow_decision_to_execution_always_denied(canonical_authorities, state):
     """Test complete flow: Decision Core → Authority → Execution (always denied).
     
     Validates that regardless of Decision Core state, execution is always denied
-    and raises ExecutionError.
+    and raises ExecutionError. This is the one place the integration tests
+    exercise the Execution Layer.
     
     Requirements: 4.2, 4.4, 8.2
     """
-    # Test with NORMAL state (planning allowed)
-    inputs_normal = StateInputs(
-        fixed_deadlines_14d=1,
-        active_high_load_domains=1,
-        energy_scores_last_3_days=[4, 4, 5]
-    )
-    state_result = evaluate_state(inputs_normal, sample_config)
-    rule_result = get_active_rules(state_result.state, sample_config)
-    authority_normal = derive_authority(state_result, rule_result)
-    
-    assert authority_normal.execution == "DENIED"
-    
-    with pytest.raises(ExecutionError) as exc_info:
-        execute_action(action="any_action", authority=authority_normal)
-    assert str(exc_info.value) == "Automation disabled in current system version"
-    
-    # Test with OVERLOADED state (planning denied)
-    inputs_overloaded = StateInputs(
-        fixed_deadlines_14d=4,
-        active_high_load_domains=3,
-        energy_scores_last_3_days=[2, 2, 2]
-    )
-    state_result = evaluate_state(inputs_overloaded, sample_config)
-    rule_result = get_active_rules(state_result.state, sample_config)
-    authority_overloaded = derive_authority(state_result, rule_result)
+    authority = canonical_authorities[state]
     
-    assert authority_overloaded.execution == "DENIED"
+    assert authority.execution == "DENIED"
     
     with pytest.raises(ExecutionError) as exc_info:
-        execute_action(action="any_action", authority=authority_overloaded)
-    assert str(exc_info.value) == "Automation disabled in current system version"
+        execute_action(action="any_action", authority=authority)
+    assert str(exc_info.value) == DISABLED_MESSAGE
 
 
 # Test 3: Scenario runner end-to-end
-def test_scenario_runner_end_to_end(sample_config, tmp_path):
+def test_scenario_runner_end_to_end(sample_config, yaml_file):
     """Test scenario runner end-to-end with real scenario file.
     
     Validates that:
@@ -217,36 +290,8 @@ def test_scenario_runner_end_to_end(sample_config, tmp_path):
     
     Requirements: 8.3
     """
-    # Create a temporary scenario file
-    scenario_file = tmp_path / "test_scenarios.yaml"
-    scenario_content = """
-scenarios:
-  - name: "Test Overload"
-    inputs:
-      fixed_deadlines_14d: 4
-      active_high_load_domains: 3
-      energy_scores_last_3_days: [2, 2, 2]
-    expected:
-      state: OVERLOADED
-      planning: DENIED
-      execution: DENIED
-      mode: CONTAINMENT
-  
-  - name: "Test Normal"
-    inputs:
-      fixed_deadlines_14d: 1
-      active_high_load_domains: 1
-      energy_scores_last_3_days: [4, 4, 5]
-    expected:
-      state: NORMAL
-      planning: ALLOWED
-      execution: DENIED
-      mode: NORMAL
-"""
-    scenario_file.write_text(scenario_content)
-    
     # Load scenarios
-    scenarios = load_scenarios(str(scenario_file))
+    scenarios = load_scenarios(yaml_file(SCENARIOS_YAML))
     assert len(scenarios) == 2
     
     # Run first scenario (OVERLOADED)
@@ -263,11 +308,14 @@ scenarios:
     
     # Format output for first scenario
     output1 = format_scenario_output(result1)
-    assert "SCENARIO: Test Overload" in output1
-    assert "STATE: OVERLOADED" in output1
-    assert "planning: DENIED" in output1
-    assert "execution: DENIED" in output1
-    assert "MODE: CONTAINMENT" in output1
+    expected1 = {
+        "SCENARIO: Test Overload",
+        "STATE: OVERLOADED",
+        "planning: DENIED",
+        "execution: DENIED",
+        "MODE: CONTAINMENT",
+    }
+    assert find_patterns(output1, expected1) == expected1
     
     # Run second scenario (NORMAL)
     result2 = run_scenario(scenarios[1], sample_config)
@@ -283,154 +331,98 @@ scenarios:
     
     # Format output for second scenario
     output2 = format_scenario_output(result2)
-    assert "SCENARIO: Test Normal" in output2
-    assert "STATE: NORMAL" in output2
-    assert "planning: ALLOWED" in output2
-    assert "execution: DENIED" in output2
-    assert "MODE: NORMAL" in output2
+    expected2 = {
+        "SCENARIO: Test Normal",
+        "STATE: NORMAL",
+        "planning: ALLOWED",
+        "execution: DENIED",
+        "MODE: NORMAL",
+    }
+    assert find_patterns(output2, expected2) == expected2
 
 
 # Test 4: All layers respect authority boundaries
-def test_all_layers_respect_authority_boundaries(sample_config):
+def test_all_layers_respect_authority_boundaries(canonical_authorities):
     """Test that all layers respect authority boundaries.
     
     Validates that:
     1. Planning Engine checks authority before operation
-    2. Execution Layer checks authority before operation
-    3. No layer can bypass authority enforcement
+    2. No layer can bypass authority enforcement
     
-    Requirements: 4.1, 4.2, 4.3, 4.4, 8.4
+    The Execution Layer is covered by
+    test_complete_flow_decision_to_execution_always_denied.
+    
+    Requirements: 4.1, 4.3, 8.4
     """
-    # Create OVERLOADED state with DENIED permissions
-    inputs_denied = StateInputs(
-        fixed_deadlines_14d=4,
-        active_high_load_domains=3,
-        energy_scores_last_3_days=[2, 2, 2]
-    )
-    state_result = evaluate_state(inputs_denied, sample_config)
-    rule_result = get_active_rules(state_result.state, sample_config)
-    authority_denied = derive_authority(state_result, rule_result)
+    # OVERLOADED state with DENIED permissions
+    authority_denied = canonical_authorities["OVERLOADED"]
     
     # Verify Planning Engine respects DENIED authority
-    plan_request_denied = PlanRequest(
-        tasks=[],
-        constraints=Constraint(),
-        decision_state=authority_denied
-    )
-    plan_result_denied = propose_plan(plan_request_denied)
-    assert plan_result_denied.advisory is None
-    assert "ADVICE BLOCKED" in plan_result_denied.reason
-    assert "Planning forbidden by Decision Core" in plan_result_denied.reason
-    
-    # Verify Execution Layer respects DENIED authority (always denied)
-    with pytest.raises(ExecutionError):
-        execute_action(action="test_action", authority=authority_denied)
+    assert_planning_blocked(authority_denied)
     
-    # Create NORMAL state with ALLOWED planning
-    inputs_allowed = StateInputs(
-        fixed_deadlines_14d=1,
-        active_high_load_domains=1,
-        energy_scores_last_3_days=[4, 4, 5]
-    )
-    state_result = evaluate_state(inputs_allowed, sample_config)
-    rule_result = get_active_rules(state_result.state, sample_config)
-    authority_allowed = derive_authority(state_result, rule_result)
+    # NORMAL state with ALLOWED planning
+    authority_allowed = canonical_authorities["NORMAL"]
     
     # Verify Planning Engine respects ALLOWED authority
     plan_request_allowed = PlanRequest(
         tasks=[],
-        constraints=Constraint(),
+        constraints=EMPTY_CONSTRAINT,
         decision_state=authority_allowed
     )
     plan_result_allowed = propose_plan(plan_request_allowed)
     # Planning is allowed and advisory is provided
     assert plan_result_allowed.advisory is not None
     assert plan_result_allowed.reason == "Advisory analysis complete"
-    
-    # Verify Execution Layer still denies even with ALLOWED planning
-    with pytest.raises(ExecutionError):
-        execute_action(action="test_action", authority=authority_allowed)
 
 
 # Test 5: CLI commands with real scenario files
-def test_cli_scenario_run_command(tmp_path):
+def test_cli_scenario_run_command(yaml_file, capsys, monkeypatch):
     """Test CLI 'scenario run' command with real scenario file.
     
     Requirements: 8.3
     """
-    # Create a temporary scenario file
-    scenario_file = tmp_path / "cli_test.yaml"
-    scenario_content = """
-scenarios:
-  - name: "CLI Test Scenario"
-    inputs:
-      fixed_deadlines_14d: 4
-      active_high_load_domains: 3
-      energy_scores_last_3_days: [2, 2, 2]
-"""
-    scenario_file.write_text(scenario_content)
+    scenario_file = yaml_file(SCENARIOS_YAML)
     
-    # Run CLI command
-    result = subprocess.run(
-        [sys.executable, "-m", "pl_dss.plo_cli", "scenario", "run", 
-         "--name", "CLI Test Scenario", "--file", str(scenario_file)],
-        capture_output=True,
-        text=True
-    )
+    # Run CLI command (from the project root, where config.yaml lives)
+    monkeypatch.chdir(REPO_ROOT)
+    exit_code = run_cli(["scenario", "run", "--name", "Test Overload", "--file", scenario_file])
+    captured = capsys.readouterr()
     
     # Verify command succeeded
-    assert result.returncode == 0
+    assert exit_code == 0
     
     # Verify output contains expected sections
-    assert "SCENARIO: CLI Test Scenario" in result.stdout
-    assert "STATE:" in result.stdout
-    assert "AUTHORITY:" in result.stdout
-    assert "MODE:" in result.stdout
-    assert "ACTIVE RULES:" in result.stdout
+    expected = REPORT_SECTIONS | {"SCENARIO: Test Overload"}
+    assert find_patterns(captured.out, expected) == expected
 
 
-def test_cli_scenario_run_all_command(tmp_path):
+def test_cli_scenario_run_all_command(yaml_file, capsys, monkeypatch):
     """Test CLI 'scenario run-all' command with real scenario file.
     
     Requirements: 8.3
     """
-    # Create a temporary scenario file with multiple scenarios
-    scenario_file = tmp_path / "cli_test_all.yaml"
-    scenario_content = """
-scenarios:
-  - name: "Scenario 1"
-    inputs:
-      fixed_deadlines_14d: 4
-      active_high_load_domains: 3
-      energy_scores_last_3_days: [2, 2, 2]
-  
-  - name: "Scenario 2"
-    inputs:
-      fixed_deadlines_14d: 1
-      active_high_load_domains: 1
-      energy_scores_last_3_days: [4, 4, 5]
-"""
-    scenario_file.write_text(scenario_content)
+    scenario_file = yaml_file(SCENARIOS_YAML)
     
-    # Run CLI command
-    result = subprocess.run(
-        [sys.executable, "-m", "pl_dss.plo_cli", "scenario", "run-all",
-         "--file", str(scenario_file)],
-        capture_output=True,
-        text=True
-    )
+    # Run CLI command (from the project root, where config.yaml lives)
+    monkeypatch.chdir(REPO_ROOT)
+    exit_code = run_cli(["scenario", "run-all", "--file", scenario_file])
+    captured = capsys.readouterr()
     
     # Verify command succeeded
-    assert result.returncode == 0
+    assert exit_code == 0
     
     # Verify output contains both scenarios
-    assert "SCENARIO: Scenario 1" in result.stdout
-    assert "SCENARIO: Scenario 2" in result.stdout
+    expected = {"SCENARIO: Test Overload", "SCENARIO: Test Normal"}
+    assert find_patterns(captured.out, expected) == expected
 
 
+@pytest.mark.subprocess_test
 def test_cli_evaluate_command():
     """Test CLI 'evaluate' command.
     
+    Runs the CLI as a subprocess to cover the `python -m` entry point;
+    the other CLI tests call run_cli() in-process.
+    
     Requirements: 8.3
     """
     # Run CLI command with OVERLOADED inputs
@@ -438,52 +430,37 @@ def test_cli_evaluate_command():
         [sys.executable, "-m", "pl_dss.plo_cli", "evaluate",
          "--deadlines", "4", "--domains", "3", "--energy", "2", "2", "2"],
         capture_output=True,
-        text=True
+        text=True,
+        cwd=REPO_ROOT
     )
     
     # Verify command succeeded
     assert result.returncode == 0
     
     # Verify output contains expected sections
-    assert "STATE:" in result.stdout
-    assert "AUTHORITY:" in result.stdout
-    assert "MODE:" in result.stdout
-    assert "ACTIVE RULES:" in result.stdout
+    assert find_patterns(result.stdout, REPORT_SECTIONS) == REPORT_SECTIONS
 
 
-def test_cli_scenario_validate_command(tmp_path):
+def test_cli_scenario_validate_command(yaml_file, capsys, monkeypatch):
     """Test CLI 'scenario validate' command.
     
     Requirements: 8.3
     """
-    # Create a valid scenario file
-    scenario_file = tmp_path / "validate_test.yaml"
-    scenario_content = """
-scenarios:
-  - name: "Valid Scenario"
-    inputs:
-      fixed_deadlines_14d: 2
-      active_high_load_domains: 2
-      energy_scores_last_3_days: [3, 3, 3]
-"""
-    scenario_file.write_text(scenario_content)
+    scenario_file = yaml_file(SCENARIOS_YAML)
     
-    # Run CLI command
-    result = subprocess.run(
-        [sys.executable, "-m", "pl_dss.plo_cli", "scenario", "validate",
-         "--file", str(scenario_file)],
-        capture_output=True,
-        text=True
-    )
+    # Run CLI command (from the project root, where config.yaml lives)
+    monkeypatch.chdir(REPO_ROOT)
+    exit_code = run_cli(["scenario", "validate", "--file", scenario_file])
+    captured = capsys.readouterr()
     
     # Verify command succeeded
-    assert result.returncode == 0
-    assert "Scenario file is valid" in result.stdout
-    assert "Valid Scenario" in result.stdout
+    assert exit_code == 0
+    assert "Scenario file is valid" in captured.out
+    assert "Test Overload" in captured.out
 
 
 # Test 7: Advisory scenario output formatting
-def test_advisory_scenario_output_formatting(sample_config, tmp_path):
+def test_advisory_scenario_output_formatting(sample_config):
     """Test that advisory scenarios are formatted correctly in output.
     
     Validates that:
@@ -494,100 +471,73 @@ def test_advisory_scenario_output_formatting(sample_config, tmp_path):
     
     Requirements: 19.1, 19.2, 19.3, 19.4
     """
-    # Create advisory scenario file
-    scenario_file = tmp_path / "advisory_test.yaml"
-    scenario_content = """
-advisory_scenarios:
-  - name: "Test Advisory Allowed"
-    inputs:
-      fixed_deadlines_14d: 1
-      active_high_load_domains: 1
-      energy_scores_last_3_days: [4, 4, 5]
-      tasks:
-        - name: "Task 1"
-          deadline: "2026-02-12"
-          type: "coursework"
-        - name: "Task 2"
-          deadline: "2026-02-11"
-          type: "admin"
-        - name: "Task 3"
-          deadline: "2026-02-13"
-          type: "work"
-      constraints:
-        max_parallel_focus: 2
-    expected:
-      state: NORMAL
-      planning: ALLOWED
-      advisory_contains:
-        - "3 deadlines"
-        - "3-day window"
-  
-  - name: "Test Advisory Blocked"
-    inputs:
-      fixed_deadlines_14d: 4
-      active_high_load_domains: 3
-      energy_scores_last_3_days: [2, 2, 2]
-      tasks:
-        - name: "Task 1"
-          deadline: "2026-02-12"
-          type: "work"
-      constraints:
-        max_parallel_focus: 2
-    expected:
-      state: OVERLOADED
-      planning: DENIED
-      advisory_blocked: true
-"""
-    scenario_file.write_text(scenario_content)
-    
     # Load scenarios
-    scenarios = load_scenarios(str(scenario_file))
+    scenarios = load_scenarios(ADVISORY_SCENARIOS_DATA)
     assert len(scenarios) == 2
     
     # Test scenario 1: Advisory allowed
     result1 = run_scenario(scenarios[0], sample_config)
     output1 = format_scenario_output(result1)
     
-    # Verify standard sections are present
-    assert "SCENARIO: Test Advisory Allowed" in output1
-    assert "STATE: NORMAL" in output1
-    assert "AUTHORITY:" in output1
-    assert "planning: ALLOWED" in output1
-    assert "execution: DENIED" in output1
-    assert "MODE: NORMAL" in output1
-    assert "ACTIVE RULES:" in output1
-    
-    # Verify advisory output is present and formatted correctly (Requirements 19.1, 19.2, 19.3, 19.4)
-    assert "PLANNING ADVISORY:" in output1  # Requirement 19.1
-    assert "- 3 deadlines fall within a 3-day window" in output1  # Requirement 19.2 (bullet points)
-    assert "- Recommendation:" in output1  # Requirement 19.3 (nested bullets)
-    assert "  •" in output1  # Requirement 19.3 (nested bullet marker)
-    
-    # Verify no formatting codes (Requirement 19.4)
-    assert "**" not in output1  # No markdown bold
-    assert "__" not in output1  # No markdown underline
+    # Verify standard sections and advisory output are present and formatted
+    # correctly (Requirements 19.1, 19.2, 19.3, 19.4), scanning output once
+    expected1 = {
+        # Standard sections
+        "SCENARIO: Test Advisory Allowed",
+        "STATE: NORMAL",
+        "AUTHORITY:",
+        "planning: ALLOWED",
+        "execution: DENIED",
+        "MODE: NORMAL",
+        "ACTIVE RULES:",
+        "PLANNING ADVISORY:",  # Requirement 19.1
+        "- 3 deadlines fall within a 3-day window",  # Requirement 19.2 (bullet points)
+        "- Recommendation:",  # Requirement 19.3 (nested bullets)
+        "  •",  # Requirement 19.3 (nested bullet marker)
+    }
+    # Formatting codes that must not appear (Requirement 19.4): markdown bold
+    # and underline
+    forbidden1 = {"**", "__"}
+    hits1 = find_patterns(output1, expected1 | forbidden1)
+    assert hits1 & expected1 == expected1
+    assert not hits1 & forbidden1
     assert "<" not in output1 or ">" not in output1  # No HTML tags
     
     # Test scenario 2: Advisory blocked
     result2 = run_scenario(scenarios[1], sample_config)
     output2 = format_scenario_output(result2)
     
-    # Verify standard sections are present
-    assert "SCENARIO: Test Advisory Blocked" in output2
-    assert "STATE: OVERLOADED" in output2
-    assert "planning: DENIED" in output2
-    
-    # Verify blocked message is present instead of advisory
-    assert "ADVICE BLOCKED" in output2
-    assert "Planning forbidden by Decision Core" in output2
-    
-    # Verify no advisory analysis is present
-    assert "PLANNING ADVISORY:" not in output2
-    assert "Recommendation:" not in output2
+    # Verify standard sections and the blocked message are present instead
+    # of advisory analysis
+    expected2 = {
+        "SCENARIO: Test Advisory Blocked",
+        "STATE: OVERLOADED",
+        "planning: DENIED",
+        "ADVICE BLOCKED",
+        "Planning forbidden by Decision Core",
+    }
+    forbidden2 = {"PLANNING ADVISORY:", "Recommendation:"}
+    hits2 = find_patterns(output2, expected2 | forbidden2)
+    assert hits2 & expected2 == expected2
+    assert not hits2 & forbidden2
+
+
+@pytest.mark.parametrize("data", [
+    {},
+    {"scenarios": []},
+    {"scenarios": [{"name": "Missing inputs"}]},
+])
+def test_load_scenarios_from_mapping_validates_structure(data):
+    """Test that dictionary input is validated like file content.
+    
+    Requirements: 5.1
+    """
+    with pytest.raises(ScenarioError):
+        load_scenarios(data)
 
 
 # Test 8: Advisory scenario with real test_scenarios.yaml file
-def test_advisory_scenarios_from_real_file(sample_config):
+def test_advisory_scenarios_from_real_file(sample_config, real_scenarios):
     """Test advisory scenarios from the actual test_scenarios.yaml file.
     
     Validates that all advisory scenarios in the real file work correctly
@@ -595,11 +545,8 @@ def test_advisory_scenarios_from_real_file(sample_config):
     
     Requirements: 19.1, 19.2, 19.3, 19.4, 21.1, 21.2
     """
-    # Load scenarios from real file
-    scenarios = load_scenarios("scenarios/test_scenarios.yaml")
-    
-    # Find advisory scenarios
-    advisory_scenarios = [s for s in scenarios if s.tasks is not None]
+    # Find advisory scenarios in the real file (loaded once per session)
+    advisory_scenarios = [s for s in real_scenarios if s.tasks is not None]
     assert len(advisory_scenarios) >= 3  # Should have at least 3 advisory scenarios
     
     # Test each advisory scenario
@@ -608,11 +555,8 @@ def test_advisory_scenarios_from_real_file(sample_config):
         output = format_scenario_output(result)
         
         # Verify output contains required sections
-        assert f"SCENARIO: {scenario.name}" in output
-        assert "STATE:" in output
-        assert "AUTHORITY:" in output
-        assert "MODE:" in output
-        assert "ACTIVE RULES:" in output
+        required = {f"SCENARIO: {scenario.name}", "STATE:", "AUTHORITY:", "MODE:", "ACTIVE RULES:"}
+        assert find_patterns(output, required) == required
         
         # Check if planning was allowed or denied
         if result.authority.planning == "ALLOWED":
@@ -629,77 +573,3 @@ def test_advisory_scenarios_from_real_file(sample_config):
             assert "Planning forbidden by Decision Core" in output
             # Should NOT have advisory output
             assert "PLANNING ADVISORY:" not in output
-
-
-# Test 6: Authority enforcement across state transitions
-def test_authority_enforcement_across_state_transitions(sample_config):
-    """Test that authority is correctly enforced across state transitions.
-    
-    Validates that as system state changes, authority permissions change
-    accordingly and all layers respect the new authority.
-    
-    Requirements: 4.1, 4.2, 4.3, 4.4, 8.4
-    """
-    # Start in NORMAL state
-    inputs_normal = StateInputs(
-        fixed_deadlines_14d=1,
-        active_high_load_domains=1,
-        energy_scores_last_3_days=[4, 4, 5]
-    )
-    state_result = evaluate_state(inputs_normal, sample_config)
-    rule_result = get_active_rules(state_result.state, sample_config)
-    authority = derive_authority(state_result, rule_result)
-    
-    assert authority.state == "NORMAL"
-    assert authority.planning == "ALLOWED"
-    assert authority.execution == "DENIED"
-    
-    # Planning should not be blocked
-    plan_request = PlanRequest(tasks=[], constraints=Constraint(), decision_state=authority)
-    plan_result = propose_plan(plan_request)
-    assert plan_result.advisory is not None
-    assert plan_result.reason == "Advisory analysis complete"
-    
-    # Transition to STRESSED state
-    inputs_stressed = StateInputs(
-        fixed_deadlines_14d=3,
-        active_high_load_domains=2,
-        energy_scores_last_3_days=[3, 3, 3]
-    )
-    state_result = evaluate_state(inputs_stressed, sample_config)
-    rule_result = get_active_rules(state_result.state, sample_config)
-    authority = derive_authority(state_result, rule_result)
-    
-    assert authority.state == "STRESSED"
-    assert authority.planning == "DENIED"
-    assert authority.execution == "DENIED"
-    
-    # Planning should now be blocked
-    plan_request = PlanRequest(tasks=[], constraints=Constraint(), decision_state=authority)
-    plan_result = propose_plan(plan_request)
-    assert "ADVICE BLOCKED" in plan_result.reason
-    assert "Planning forbidden by Decision Core" in plan_result.reason
-    
-    # Transition to OVERLOADED state
-    inputs_overloaded = StateInputs(
-        fixed_deadlines_14d=4,
-        active_high_load_domains=3,
-        energy_scores_last_3_days=[2, 2, 2]
-    )
-    state_result = evaluate_state(inputs_overloaded, sample_config)
-    rule_result = get_active_rules(state_result.state, sample_config)
-    authority = derive_authority(state_result, rule_result)
-    
-    assert authority.state == "OVERLOADED"
-    assert authority.planning == "DENIED"
-    assert authority.execution == "DENIED"
-    
-    # Planning should still be blocked
-    plan_request = PlanRequest(tasks=[], constraints=Constraint(), decision_state=authority)
-    plan_result = propose_plan(plan_request)
-    assert "ADVICE BLOCKED" in plan_result.reason
-    assert "Planning forbidden by Decision Core" in plan_result.reason
-    
-    # Execution should always be denied regardless of state
-    with pytest.raises(ExecutionError):
-        execute_action(action="test", authority=authority)
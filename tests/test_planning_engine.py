@@ -19,9 +19,20 @@ from pl_dss.planning import (
     AdvisoryOutput
 )
 from pl_dss.authority import GlobalAuthority
+from pl_dss import execution
 
 
-@pytest.fixture
+# Request parts shared across tests. propose_plan only reads its request, so
+# these instances are never modified.
+ONE_WORK_TASK = [Task(name="Task 1", deadline="2026-02-15", type="work")]
+TWO_WORK_TASKS = [
+    Task(name="Task 1", deadline="2026-02-15", type="work"),
+    Task(name="Task 2", deadline="2026-02-16", type="work")
+]
+FOCUS_LIMIT_2 = Constraint(max_parallel_focus=2)
+
+
+@pytest.fixture(scope="module")
 def denied_authority():
     """Create a GlobalAuthority with planning DENIED."""
     return GlobalAuthority(
@@ -33,7 +44,7 @@ def denied_authority():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def allowed_authority():
     """Create a GlobalAuthority with planning ALLOWED."""
     return GlobalAuthority(
@@ -82,144 +93,70 @@ def test_propose_plan_function_exists():
     assert hasattr(result, 'blocked_by')
 
 
-def test_propose_plan_with_denied_authority(denied_authority):
-    """Test propose_plan with DENIED authority.
+# (authority fixture, tasks, constraints, expect_advisory). The two
+# "two work tasks" cases send the same request under both authorities.
+AUTHORITY_MATRIX = [
+    pytest.param("denied_authority", TWO_WORK_TASKS, FOCUS_LIMIT_2, False, id="denied-two-work-tasks"),
+    pytest.param("allowed_authority", TWO_WORK_TASKS, FOCUS_LIMIT_2, True, id="allowed-two-work-tasks"),
+    pytest.param(
+        "allowed_authority",
+        [
+            Task(name="Test Task 1", deadline="2026-02-15", type="coursework"),
+            Task(name="Test Task 2", deadline="2026-02-16", type="admin")
+        ],
+        FOCUS_LIMIT_2,
+        True,
+        id="allowed-mixed-tasks"
+    ),
+    pytest.param("allowed_authority", [], Constraint(), True, id="allowed-empty-tasks"),
+]
+
+
+@pytest.mark.parametrize("authority_fixture,tasks,constraints,expect_advisory", AUTHORITY_MATRIX)
+def test_propose_plan_respects_authority(request, authority_fixture, tasks, constraints, expect_advisory):
+    """Test propose_plan under DENIED and ALLOWED authority.
     
     Validates that when planning permission is DENIED:
     - Returns PlanResult with advisory=None
     - Returns reason containing "ADVICE BLOCKED"
     - Returns reason containing "Planning forbidden by Decision Core"
     - Returns blocked_by="Decision Core"
-    - Does NOT provide any advisory analysis
-    
-    Requirements: 2.1, 2.3, 2.4
-    """
-    # Create request with DENIED authority
-    request = PlanRequest(
-        tasks=[
-            Task(name="Test Task", deadline="2026-02-15", type="work")
-        ],
-        constraints=Constraint(max_parallel_focus=2),
-        decision_state=denied_authority
-    )
     
-    # Call propose_plan
-    result = propose_plan(request)
-    
-    # Verify planning was blocked
-    assert result.advisory is None
-    assert "ADVICE BLOCKED" in result.reason
-    assert "Planning forbidden by Decision Core" in result.reason
-    assert result.blocked_by == "Decision Core"
-
-
-def test_propose_plan_with_allowed_authority(allowed_authority):
-    """Test propose_plan with ALLOWED authority.
-    
-    Validates that when planning permission is ALLOWED:
-    - Returns PlanResult with advisory (not None)
-    - Advisory is an AdvisoryOutput object
-    - Returns appropriate reason
+    Validates that when planning permission is ALLOWED (including with an
+    empty task list):
+    - Returns an AdvisoryOutput with observations, recommendations and warnings lists
+    - Returns reason "Advisory analysis complete"
     - blocked_by is None
-    - Provides advisory analysis
     
-    Requirements: 2.1, 2.5
+    Requirements: 2.1, 2.2, 2.3, 2.4, 2.5
     """
-    # Create request with ALLOWED authority
-    request = PlanRequest(
-        tasks=[
-            Task(name="Test Task 1", deadline="2026-02-15", type="coursework"),
-            Task(name="Test Task 2", deadline="2026-02-16", type="admin")
-        ],
-        constraints=Constraint(max_parallel_focus=2),
-        decision_state=allowed_authority
-    )
+    authority = request.getfixturevalue(authority_fixture)
     
-    # Call propose_plan
-    result = propose_plan(request)
+    result = propose_plan(PlanRequest(
+        tasks=tasks,
+        constraints=constraints,
+        decision_state=authority
+    ))
+    
+    if not expect_advisory:
+        # Verify planning was blocked
+        assert result.advisory is None
+        assert "ADVICE BLOCKED" in result.reason
+        assert "Planning forbidden by Decision Core" in result.reason
+        assert result.blocked_by == "Decision Core"
+        return
     
     # Verify planning was not blocked
-    assert result.advisory is not None
     assert isinstance(result.advisory, AdvisoryOutput)
     assert result.reason == "Advisory analysis complete"
     assert result.blocked_by is None
     
     # Verify advisory has expected structure
-    assert hasattr(result.advisory, 'observations')
-    assert hasattr(result.advisory, 'recommendations')
-    assert hasattr(result.advisory, 'warnings')
     assert isinstance(result.advisory.observations, list)
     assert isinstance(result.advisory.recommendations, list)
     assert isinstance(result.advisory.warnings, list)
 
 
-def test_propose_plan_with_allowed_authority_empty_tasks(allowed_authority):
-    """Test propose_plan with ALLOWED authority and empty task list.
-    
-    Validates that the function handles empty task lists gracefully
-    when planning is allowed.
-    
-    Requirements: 2.1
-    """
-    # Create request with empty tasks
-    request = PlanRequest(
-        tasks=[],
-        constraints=Constraint(),
-        decision_state=allowed_authority
-    )
-    
-    # Call propose_plan
-    result = propose_plan(request)
-    
-    # Verify planning was not blocked
-    assert result.advisory is not None
-    assert isinstance(result.advisory, AdvisoryOutput)
-    assert result.reason == "Advisory analysis complete"
-    assert result.blocked_by is None
-
-
-def test_propose_plan_respects_authority_state(denied_authority, allowed_authority):
-    """Test that propose_plan respects the authority state consistently.
-    
-    Validates that the same request produces different results based on
-    the authority state.
-    
-    Requirements: 2.1, 2.2
-    """
-    # Create identical task lists
-    tasks = [
-        Task(name="Task 1", deadline="2026-02-15", type="work"),
-        Task(name="Task 2", deadline="2026-02-16", type="work")
-    ]
-    constraints = Constraint(max_parallel_focus=2)
-    
-    # Request with DENIED authority
-    request_denied = PlanRequest(
-        tasks=tasks,
-        constraints=constraints,
-        decision_state=denied_authority
-    )
-    result_denied = propose_plan(request_denied)
-    
-    # Request with ALLOWED authority
-    request_allowed = PlanRequest(
-        tasks=tasks,
-        constraints=constraints,
-        decision_state=allowed_authority
-    )
-    result_allowed = propose_plan(request_allowed)
-    
-    # Verify different results based on authority
-    assert result_denied.advisory is None
-    assert result_allowed.advisory is not None
-    
-    assert "ADVICE BLOCKED" in result_denied.reason
-    assert "Advisory analysis complete" == result_allowed.reason
-    
-    assert result_denied.blocked_by == "Decision Core"
-    assert result_allowed.blocked_by is None
-
-
 # Unit tests for Planning Advisor (Task 2.19)
 # Requirements: 13.4, 13.5, 20.3
 
@@ -243,7 +180,7 @@ def test_constraint_max_parallel_focus_support(allowed_authority):
     
     request = PlanRequest(
         tasks=tasks,
-        constraints=Constraint(max_parallel_focus=2),
+        constraints=FOCUS_LIMIT_2,
         decision_state=allowed_authority
     )
     
@@ -254,13 +191,14 @@ def test_constraint_max_parallel_focus_support(allowed_authority):
     assert result.advisory is not None
     
     # Verify cognitive load assessment detected constraint violation
-    # (3 tasks > max_parallel_focus of 2)
+    # (3 tasks > max_parallel_focus of 2). Messages are joined with NUL so a
+    # match cannot span two of them
     assert len(result.advisory.observations) > 0
-    assert any("Cognitive load" in obs for obs in result.advisory.observations)
+    assert "Cognitive load" in "\0".join(result.advisory.observations)
     
     # Verify warning about constraint violation
     assert len(result.advisory.warnings) > 0
-    assert any("max_parallel_focus" in warning for warning in result.advisory.warnings)
+    assert "max_parallel_focus" in "\0".join(result.advisory.warnings)
 
 
 def test_constraint_time_boundary_support(allowed_authority):
@@ -274,12 +212,8 @@ def test_constraint_time_boundary_support(allowed_authority):
     Requirements: 13.5
     """
     # Create request with no_work_after constraint
-    tasks = [
-        Task(name="Task 1", deadline="2026-02-15", type="work"),
-    ]
-    
     request = PlanRequest(
-        tasks=tasks,
+        tasks=ONE_WORK_TASK,
         constraints=Constraint(no_work_after="22:00"),
         decision_state=allowed_authority
     )
@@ -305,13 +239,8 @@ def test_constraint_both_constraints_support(allowed_authority):
     Requirements: 13.4, 13.5
     """
     # Create request with both constraints
-    tasks = [
-        Task(name="Task 1", deadline="2026-02-15", type="work"),
-        Task(name="Task 2", deadline="2026-02-16", type="work"),
-    ]
-    
     request = PlanRequest(
-        tasks=tasks,
+        tasks=TWO_WORK_TASKS,
         constraints=Constraint(
             max_parallel_focus=3,
             no_work_after="22:00"
@@ -329,7 +258,7 @@ def test_constraint_both_constraints_support(allowed_authority):
     assert request.constraints.no_work_after == "22:00"
 
 
-def test_planning_advisor_does_not_call_execution_layer(allowed_authority):
+def test_planning_advisor_does_not_call_execution_layer(allowed_authority, monkeypatch):
     """Test that Planning Advisor doesn't call execution layer functions.
     
     Validates that:
@@ -342,50 +271,35 @@ def test_planning_advisor_does_not_call_execution_layer(allowed_authority):
     
     Requirements: 20.3
     """
-    # Import execution module to verify it's not called
-    from pl_dss import execution
-    
-    # Track if execute_action was called
-    original_execute = execution.execute_action
-    call_count = [0]
-    
-    def mock_execute(*args, **kwargs):
-        call_count[0] += 1
-        return original_execute(*args, **kwargs)
-    
-    # Temporarily replace execute_action to track calls
-    execution.execute_action = mock_execute
-    
-    try:
-        # Create request with tasks
-        tasks = [
-            Task(name="Task 1", deadline="2026-02-15", type="work"),
-            Task(name="Task 2", deadline="2026-02-16", type="admin"),
-            Task(name="Task 3", deadline="2026-02-17", type="coursework"),
-        ]
-        
-        request = PlanRequest(
-            tasks=tasks,
-            constraints=Constraint(max_parallel_focus=2),
-            decision_state=allowed_authority
-        )
-        
-        # Call propose_plan
-        result = propose_plan(request)
-        
-        # Verify planning completed successfully
-        assert result.advisory is not None
-        assert result.reason == "Advisory analysis complete"
-        
-        # Verify execute_action was NEVER called
-        assert call_count[0] == 0, "Planning Advisor should not call execution layer"
-        
-    finally:
-        # Restore original function
-        execution.execute_action = original_execute
+    # Record any call to execute_action (monkeypatch restores it afterwards)
+    calls = []
+    monkeypatch.setattr(execution, "execute_action", lambda *args, **kwargs: calls.append(args))
+    
+    # Create request with tasks
+    tasks = [
+        Task(name="Task 1", deadline="2026-02-15", type="work"),
+        Task(name="Task 2", deadline="2026-02-16", type="admin"),
+        Task(name="Task 3", deadline="2026-02-17", type="coursework"),
+    ]
+    
+    request = PlanRequest(
+        tasks=tasks,
+        constraints=FOCUS_LIMIT_2,
+        decision_state=allowed_authority
+    )
+    
+    # Call propose_plan
+    result = propose_plan(request)
+    
+    # Verify planning completed successfully
+    assert result.advisory is not None
+    assert result.reason == "Advisory analysis complete"
+    
+    # Verify execute_action was NEVER called
+    assert not calls, "Planning Advisor should not call execution layer"
 
 
-def test_planning_advisor_no_execution_with_denied_authority(denied_authority):
+def test_planning_advisor_no_execution_with_denied_authority(denied_authority, monkeypatch):
     """Test that Planning Advisor doesn't call execution even when denied.
     
     Validates that:
@@ -394,41 +308,23 @@ def test_planning_advisor_no_execution_with_denied_authority(denied_authority):
     
     Requirements: 20.3
     """
-    # Import execution module
-    from pl_dss import execution
-    
-    # Track if execute_action was called
-    original_execute = execution.execute_action
-    call_count = [0]
-    
-    def mock_execute(*args, **kwargs):
-        call_count[0] += 1
-        return original_execute(*args, **kwargs)
-    
-    execution.execute_action = mock_execute
-    
-    try:
-        # Create request with DENIED authority
-        tasks = [
-            Task(name="Task 1", deadline="2026-02-15", type="work"),
-        ]
-        
-        request = PlanRequest(
-            tasks=tasks,
-            constraints=Constraint(max_parallel_focus=2),
-            decision_state=denied_authority
-        )
-        
-        # Call propose_plan
-        result = propose_plan(request)
-        
-        # Verify planning was blocked
-        assert result.advisory is None
-        assert "ADVICE BLOCKED" in result.reason
-        
-        # Verify execute_action was NEVER called
-        assert call_count[0] == 0, "Planning Advisor should not call execution layer"
-        
-    finally:
-        # Restore original function
-        execution.execute_action = original_execute
+    # Record any call to execute_action (monkeypatch restores it afterwards)
+    calls = []
+    monkeypatch.setattr(execution, "execute_action", lambda *args, **kwargs: calls.append(args))
+    
+    # Create request with DENIED authority
+    request = PlanRequest(
+        tasks=ONE_WORK_TASK,
+        constraints=FOCUS_LIMIT_2,
+        decision_state=denied_authority
+    )
+    
+    # Call propose_plan
+    result = propose_plan(request)
+    
+    # Verify planning was blocked
+    assert result.advisory is None
+    assert "ADVICE BLOCKED" in result.reason
+    
+    # Verify execute_action was NEVER called
+    assert not calls, "Planning Advisor should not call execution layer"
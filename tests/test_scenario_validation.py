@@ -7,13 +7,28 @@ Requirements: 10.1, 10.2, 10.3, 10.4, 21.3, 21.4, 21.5
 """
 
 import pytest
+import re
 from pathlib import Path
 
-from pl_dss.scenario_runner import load_scenarios
+
+# Task deadlines are ISO dates (YYYY-MM-DD)
+ISO_DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+@pytest.fixture(scope="module")
+def scenarios_by_name(real_scenarios):
+    """Index the real scenario file by scenario name, once per module."""
+    return {s.name: s for s in real_scenarios}
+
+
+@pytest.fixture(scope="module")
+def advisory_scenarios(real_scenarios):
+    """Scenarios from the real scenario file that define tasks."""
+    return [s for s in real_scenarios if s.tasks is not None]
 
 
 # Test 1: All required basic scenarios exist
-def test_required_basic_scenarios_exist():
+def test_required_basic_scenarios_exist(scenarios_by_name):
     """Test that all required basic scenarios exist in test_scenarios.yaml.
     
     Requirements: 10.1, 10.2, 10.3, 10.4
@@ -24,12 +39,6 @@ def test_required_basic_scenarios_exist():
     - Normal Operation (NORMAL state)
     - Recovery Transition (recovery path)
     """
-    # Load scenarios from the test file
-    scenarios = load_scenarios("scenarios/test_scenarios.yaml")
-    
-    # Extract scenario names
-    scenario_names = [s.name for s in scenarios]
-    
     # Check that all required scenarios exist
     required_scenarios = [
         "Sudden Load Spike",
@@ -39,144 +48,46 @@ def test_required_basic_scenarios_exist():
     ]
     
     for required_name in required_scenarios:
-        assert required_name in scenario_names, \
+        assert required_name in scenarios_by_name, \
             f"Required scenario '{required_name}' not found in test_scenarios.yaml"
 
 
-# Test 2: Sudden Load Spike scenario has expected outputs
-def test_sudden_load_spike_has_expected_outputs():
-    """Test that Sudden Load Spike scenario has expected outputs defined.
-    
-    Requirements: 10.1, 10.5
-    
-    Expected outputs:
-    - state: OVERLOADED
-    - planning: DENIED
-    - execution: DENIED
-    - mode: CONTAINMENT
-    """
-    scenarios = load_scenarios("scenarios/test_scenarios.yaml")
-    
-    # Find the Sudden Load Spike scenario
-    sudden_load_spike = next((s for s in scenarios if s.name == "Sudden Load Spike"), None)
-    assert sudden_load_spike is not None, "Sudden Load Spike scenario not found"
-    
-    # Verify expected outputs are defined
-    assert sudden_load_spike.expected is not None, \
-        "Sudden Load Spike scenario missing expected outputs"
-    
-    # Verify expected values
-    assert sudden_load_spike.expected.state == "OVERLOADED", \
-        "Sudden Load Spike should expect OVERLOADED state"
-    assert sudden_load_spike.expected.planning == "DENIED", \
-        "Sudden Load Spike should expect planning DENIED"
-    assert sudden_load_spike.expected.execution == "DENIED", \
-        "Sudden Load Spike should expect execution DENIED"
-    assert sudden_load_spike.expected.mode == "CONTAINMENT", \
-        "Sudden Load Spike should expect CONTAINMENT mode"
-
-
-# Test 3: Gradual Stress scenario has expected outputs
-def test_gradual_stress_has_expected_outputs():
-    """Test that Gradual Stress scenario has expected outputs defined.
-    
-    Requirements: 10.2, 10.5
-    
-    Expected outputs:
-    - state: STRESSED
-    - planning: DENIED
-    - execution: DENIED
-    - mode: CONTAINMENT
-    """
-    scenarios = load_scenarios("scenarios/test_scenarios.yaml")
-    
-    # Find the Gradual Stress scenario
-    gradual_stress = next((s for s in scenarios if s.name == "Gradual Stress"), None)
-    assert gradual_stress is not None, "Gradual Stress scenario not found"
-    
-    # Verify expected outputs are defined
-    assert gradual_stress.expected is not None, \
-        "Gradual Stress scenario missing expected outputs"
-    
-    # Verify expected values
-    assert gradual_stress.expected.state == "STRESSED", \
-        "Gradual Stress should expect STRESSED state"
-    assert gradual_stress.expected.planning == "DENIED", \
-        "Gradual Stress should expect planning DENIED"
-    assert gradual_stress.expected.execution == "DENIED", \
-        "Gradual Stress should expect execution DENIED"
-    assert gradual_stress.expected.mode == "CONTAINMENT", \
-        "Gradual Stress should expect CONTAINMENT mode"
-
-
-# Test 4: Normal Operation scenario has expected outputs
-def test_normal_operation_has_expected_outputs():
-    """Test that Normal Operation scenario has expected outputs defined.
-    
-    Requirements: 10.3, 10.5
-    
-    Expected outputs:
-    - state: NORMAL
-    - planning: ALLOWED
-    - execution: DENIED
-    - mode: NORMAL
-    """
-    scenarios = load_scenarios("scenarios/test_scenarios.yaml")
-    
-    # Find the Normal Operation scenario
-    normal_operation = next((s for s in scenarios if s.name == "Normal Operation"), None)
-    assert normal_operation is not None, "Normal Operation scenario not found"
-    
-    # Verify expected outputs are defined
-    assert normal_operation.expected is not None, \
-        "Normal Operation scenario missing expected outputs"
-    
-    # Verify expected values
-    assert normal_operation.expected.state == "NORMAL", \
-        "Normal Operation should expect NORMAL state"
-    assert normal_operation.expected.planning == "ALLOWED", \
-        "Normal Operation should expect planning ALLOWED"
-    assert normal_operation.expected.execution == "DENIED", \
-        "Normal Operation should expect execution DENIED"
-    assert normal_operation.expected.mode == "NORMAL", \
-        "Normal Operation should expect NORMAL mode"
+# Tests 2-5: Basic scenarios have expected outputs
+# (scenario name, state, planning, execution, mode)
+EXPECTED_OUTPUT_CASES = [
+    ("Sudden Load Spike", "OVERLOADED", "DENIED", "DENIED", "CONTAINMENT"),    # 10.1
+    ("Gradual Stress", "STRESSED", "DENIED", "DENIED", "CONTAINMENT"),         # 10.2
+    ("Normal Operation", "NORMAL", "ALLOWED", "DENIED", "NORMAL"),             # 10.3
+    ("Recovery Transition", "NORMAL", "ALLOWED", "DENIED", "NORMAL"),          # 10.4
+]
 
 
-# Test 5: Recovery Transition scenario has expected outputs
-def test_recovery_transition_has_expected_outputs():
-    """Test that Recovery Transition scenario has expected outputs defined.
-    
-    Requirements: 10.4, 10.5
+@pytest.mark.parametrize("name,state,planning,execution,mode", EXPECTED_OUTPUT_CASES)
+def test_basic_scenario_has_expected_outputs(scenarios_by_name, name, state, planning, execution, mode):
+    """Test that each basic scenario has its expected outputs defined.
     
-    Expected outputs:
-    - state: NORMAL
-    - planning: ALLOWED
-    - execution: DENIED
-    - mode: NORMAL
+    Requirements: 10.1, 10.2, 10.3, 10.4, 10.5
     """
-    scenarios = load_scenarios("scenarios/test_scenarios.yaml")
-    
-    # Find the Recovery Transition scenario
-    recovery_transition = next((s for s in scenarios if s.name == "Recovery Transition"), None)
-    assert recovery_transition is not None, "Recovery Transition scenario not found"
+    scenario = scenarios_by_name.get(name)
+    assert scenario is not None, f"{name} scenario not found"
     
     # Verify expected outputs are defined
-    assert recovery_transition.expected is not None, \
-        "Recovery Transition scenario missing expected outputs"
+    assert scenario.expected is not None, \
+        f"{name} scenario missing expected outputs"
     
     # Verify expected values
-    assert recovery_transition.expected.state == "NORMAL", \
-        "Recovery Transition should expect NORMAL state"
-    assert recovery_transition.expected.planning == "ALLOWED", \
-        "Recovery Transition should expect planning ALLOWED"
-    assert recovery_transition.expected.execution == "DENIED", \
-        "Recovery Transition should expect execution DENIED"
-    assert recovery_transition.expected.mode == "NORMAL", \
-        "Recovery Transition should expect NORMAL mode"
+    assert scenario.expected.state == state, \
+        f"{name} should expect {state} state"
+    assert scenario.expected.planning == planning, \
+        f"{name} should expect planning {planning}"
+    assert scenario.expected.execution == execution, \
+        f"{name} should expect execution {execution}"
+    assert scenario.expected.mode == mode, \
+        f"{name} should expect {mode} mode"
 
 
 # Test 6: All required advisory scenarios exist
-def test_required_advisory_scenarios_exist():
+def test_required_advisory_scenarios_exist(scenarios_by_name):
     """Test that all required advisory scenarios exist in test_scenarios.yaml.
     
     Requirements: 21.3, 21.4, 21.5
@@ -186,12 +97,6 @@ def test_required_advisory_scenarios_exist():
     - Cognitive Overload (cognitive load assessment)
     - Blocked Advisory (blocked advice when OVERLOADED)
     """
-    # Load scenarios from the test file
-    scenarios = load_scenarios("scenarios/test_scenarios.yaml")
-    
-    # Extract scenario names
-    scenario_names = [s.name for s in scenarios]
-    
     # Check that all required advisory scenarios exist
     required_advisory_scenarios = [
         "Deadline Clustering",
@@ -200,12 +105,12 @@ def test_required_advisory_scenarios_exist():
     ]
     
     for required_name in required_advisory_scenarios:
-        assert required_name in scenario_names, \
+        assert required_name in scenarios_by_name, \
             f"Required advisory scenario '{required_name}' not found in test_scenarios.yaml"
 
 
 # Test 7: Deadline Clustering scenario has expected structure
-def test_deadline_clustering_has_expected_structure():
+def test_deadline_clustering_has_expected_structure(scenarios_by_name):
     """Test that Deadline Clustering scenario has expected structure.
     
     Requirements: 21.3
@@ -217,10 +122,8 @@ def test_deadline_clustering_has_expected_structure():
     - Expected state is NORMAL
     - Expected planning is ALLOWED
     """
-    scenarios = load_scenarios("scenarios/test_scenarios.yaml")
-    
     # Find the Deadline Clustering scenario
-    deadline_clustering = next((s for s in scenarios if s.name == "Deadline Clustering"), None)
+    deadline_clustering = scenarios_by_name.get("Deadline Clustering")
     assert deadline_clustering is not None, "Deadline Clustering scenario not found"
     
     # Verify tasks are defined
@@ -243,7 +146,7 @@ def test_deadline_clustering_has_expected_structure():
 
 
 # Test 8: Cognitive Overload scenario has expected structure
-def test_cognitive_overload_has_expected_structure():
+def test_cognitive_overload_has_expected_structure(scenarios_by_name):
     """Test that Cognitive Overload scenario has expected structure.
     
     Requirements: 21.4
@@ -255,10 +158,8 @@ def test_cognitive_overload_has_expected_structure():
     - Expected state is NORMAL
     - Expected planning is ALLOWED
     """
-    scenarios = load_scenarios("scenarios/test_scenarios.yaml")
-    
     # Find the Cognitive Overload scenario
-    cognitive_overload = next((s for s in scenarios if s.name == "Cognitive Overload"), None)
+    cognitive_overload = scenarios_by_name.get("Cognitive Overload")
     assert cognitive_overload is not None, "Cognitive Overload scenario not found"
     
     # Verify tasks are defined
@@ -283,7 +184,7 @@ def test_cognitive_overload_has_expected_structure():
 
 
 # Test 9: Blocked Advisory scenario has expected structure
-def test_blocked_advisory_has_expected_structure():
+def test_blocked_advisory_has_expected_structure(scenarios_by_name):
     """Test that Blocked Advisory scenario has expected structure.
     
     Requirements: 21.5
@@ -295,10 +196,8 @@ def test_blocked_advisory_has_expected_structure():
     - Expected state is OVERLOADED
     - Expected planning is DENIED
     """
-    scenarios = load_scenarios("scenarios/test_scenarios.yaml")
-    
     # Find the Blocked Advisory scenario
-    blocked_advisory = next((s for s in scenarios if s.name == "Blocked Advisory"), None)
+    blocked_advisory = scenarios_by_name.get("Blocked Advisory")
     assert blocked_advisory is not None, "Blocked Advisory scenario not found"
     
     # Verify tasks are defined
@@ -319,7 +218,7 @@ def test_blocked_advisory_has_expected_structure():
 
 
 # Test 10: All scenarios have valid inputs
-def test_all_scenarios_have_valid_inputs():
+def test_all_scenarios_have_valid_inputs(real_scenarios):
     """Test that all scenarios have valid input structures.
     
     Requirements: 10.1, 10.2, 10.3, 10.4, 21.3, 21.4, 21.5
@@ -329,22 +228,13 @@ def test_all_scenarios_have_valid_inputs():
     - active_high_load_domains (integer)
     - energy_scores_last_3_days (list of 3 integers)
     """
-    scenarios = load_scenarios("scenarios/test_scenarios.yaml")
-    
-    for scenario in scenarios:
+    for scenario in real_scenarios:
         # Verify inputs are defined
         assert scenario.inputs is not None, \
             f"Scenario '{scenario.name}' missing inputs"
         
-        # Verify required input fields
-        assert hasattr(scenario.inputs, 'fixed_deadlines_14d'), \
-            f"Scenario '{scenario.name}' missing fixed_deadlines_14d"
-        assert hasattr(scenario.inputs, 'active_high_load_domains'), \
-            f"Scenario '{scenario.name}' missing active_high_load_domains"
-        assert hasattr(scenario.inputs, 'energy_scores_last_3_days'), \
-            f"Scenario '{scenario.name}' missing energy_scores_last_3_days"
-        
-        # Verify input types
+        # Verify input types (StateInputs is a dataclass, so the fields
+        # always exist; load_scenarios rejects files that omit them)
         assert isinstance(scenario.inputs.fixed_deadlines_14d, int), \
             f"Scenario '{scenario.name}' fixed_deadlines_14d should be integer"
         assert isinstance(scenario.inputs.active_high_load_domains, int), \
@@ -356,7 +246,7 @@ def test_all_scenarios_have_valid_inputs():
 
 
 # Test 11: Advisory scenarios have valid task structures
-def test_advisory_scenarios_have_valid_task_structures():
+def test_advisory_scenarios_have_valid_task_structures(advisory_scenarios):
     """Test that advisory scenarios have valid task structures.
     
     Requirements: 21.3, 21.4, 21.5
@@ -366,25 +256,12 @@ def test_advisory_scenarios_have_valid_task_structures():
     - deadline (string in ISO format)
     - type (string)
     """
-    scenarios = load_scenarios("scenarios/test_scenarios.yaml")
-    
-    # Filter to advisory scenarios (those with tasks)
-    advisory_scenarios = [s for s in scenarios if s.tasks is not None]
-    
     assert len(advisory_scenarios) >= 3, \
         "Should have at least 3 advisory scenarios"
     
     for scenario in advisory_scenarios:
-        # Verify each task has required fields
         for task in scenario.tasks:
-            assert hasattr(task, 'name'), \
-                f"Task in scenario '{scenario.name}' missing name"
-            assert hasattr(task, 'deadline'), \
-                f"Task in scenario '{scenario.name}' missing deadline"
-            assert hasattr(task, 'type'), \
-                f"Task in scenario '{scenario.name}' missing type"
-            
-            # Verify field types
+            # Verify field types (Task is a dataclass, so the fields always exist)
             assert isinstance(task.name, str), \
                 f"Task name in scenario '{scenario.name}' should be string"
             assert isinstance(task.deadline, str), \
@@ -392,8 +269,6 @@ def test_advisory_scenarios_have_valid_task_structures():
             assert isinstance(task.type, str), \
                 f"Task type in scenario '{scenario.name}' should be string"
             
-            # Verify deadline format (basic check for YYYY-MM-DD)
-            assert len(task.deadline) == 10, \
-                f"Task deadline in scenario '{scenario.name}' should be YYYY-MM-DD format"
-            assert task.deadline[4] == '-' and task.deadline[7] == '-', \
+            # Verify deadline format (YYYY-MM-DD)
+            assert ISO_DATE_PATTERN.fullmatch(task.deadline), \
                 f"Task deadline in scenario '{scenario.name}' should be YYYY-MM-DD format"
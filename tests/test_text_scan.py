@@ -0,0 +1,24 @@
+"""
+Unit tests for the find_patterns helper shared by the text-scanning tests.
+"""
+
+import pytest
+
+from tests.text_scan import find_patterns
+
+
+class TestFindPatterns:
+    """Tests for single-pass literal pattern scanning."""
+
+    @pytest.mark.parametrize("patterns", [[], set(), iter(())])
+    def test_no_patterns_returns_empty_set(self, patterns):
+        """Test that no patterns finds nothing, rather than matching everywhere."""
+        assert find_patterns("any text at all", patterns) == set()
+
+    def test_reports_only_present_patterns(self):
+        """Test that only patterns occurring in the text are returned."""
+        assert find_patterns("alpha beta", ["alpha", "gamma"]) == {"alpha"}
+
+    def test_reports_prefix_shadowed_by_longer_match(self):
+        """Test that a pattern occurring only as a prefix of a longer one is still found."""
+        assert find_patterns("STRESSED", ["STRESS", "STRESSED"]) == {"STRESS", "STRESSED"}
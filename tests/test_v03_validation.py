@@ -12,30 +12,35 @@ Requirements: 1.1-1.5, 2.1-2.5, 3.1-3.5, 4.1-4.6, 5.1-5.5, 6.1-6.5
 """
 
 import pytest
-from hypothesis import given, strategies as st, settings
-from typing import List
+import re
+import sys
+from itertools import chain
+from typing import List, Tuple
 
 from pl_dss.evaluator import StateInputs, evaluate_state, StateResult
 from pl_dss.authority import derive_authority, GlobalAuthority
 from pl_dss.planning import (
     PlanRequest, Task, Constraint, propose_plan, AdvisoryOutput
 )
-from pl_dss.execution import execute_action, ExecutionError
-from pl_dss.rules import get_active_rules
-from pl_dss.config import load_config
+from pl_dss.execution import execute_action, ExecutionError, DISABLED_MESSAGE
+from pl_dss.rules import get_active_rules, RuleResult
+
+
+# States the Decision Core can report
+VALID_STATES = frozenset({"NORMAL", "STRESSED", "OVERLOADED"})
 
 
 # ============================================================================
 # Test Fixtures and Helpers
 # ============================================================================
 
-@pytest.fixture
-def config():
-    """Load system configuration."""
-    return load_config()
+@pytest.fixture(scope="module")
+def config(real_config):
+    """System configuration (config.yaml, loaded once per session in conftest)."""
+    return real_config
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def normal_inputs():
     """Inputs that result in NORMAL state."""
     return StateInputs(
@@ -45,7 +50,7 @@ def normal_inputs():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def stressed_inputs():
     """Inputs that result in STRESSED state (1 condition met)."""
     return StateInputs(
@@ -55,7 +60,7 @@ def stressed_inputs():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def overloaded_inputs():
     """Inputs that result in OVERLOADED state (2+ conditions met)."""
     return StateInputs(
@@ -65,6 +70,41 @@ def overloaded_inputs():
     )
 
 
+def run_decision_core(inputs: StateInputs, config) -> Tuple[StateResult, RuleResult, GlobalAuthority]:
+    """Run Decision Core and derive authority for the given inputs.
+    
+    Returns:
+        Tuple of (state_result, rule_result, authority)
+    """
+    state_result = evaluate_state(inputs, config)
+    rule_result = get_active_rules(state_result.state, config)
+    return state_result, rule_result, derive_authority(state_result, rule_result)
+
+
+# Decision Core output per input fixture, computed once per module. The
+# pipeline is deterministic and no test modifies these results. Tests that
+# cover every state parametrize over the fixture names.
+DECISION_FIXTURES = ["normal_decision", "stressed_decision", "overloaded_decision"]
+
+
+@pytest.fixture(scope="module")
+def normal_decision(normal_inputs, config):
+    """Decision Core output for normal_inputs."""
+    return run_decision_core(normal_inputs, config)
+
+
+@pytest.fixture(scope="module")
+def stressed_decision(stressed_inputs, config):
+    """Decision Core output for stressed_inputs."""
+    return run_decision_core(stressed_inputs, config)
+
+
+@pytest.fixture(scope="module")
+def overloaded_decision(overloaded_inputs, config):
+    """Decision Core output for overloaded_inputs."""
+    return run_decision_core(overloaded_inputs, config)
+
+
 def create_test_tasks(count: int = 3) -> List[Task]:
     """Create test tasks for planning tests."""
     return [
@@ -73,6 +113,29 @@ def create_test_tasks(count: int = 3) -> List[Task]:
     ]
 
 
+# Planning tasks and requests under NORMAL and OVERLOADED authority, built
+# once per module. propose_plan does not modify its request (see
+# test_advisory_does_not_modify_input, which keeps its own tasks).
+@pytest.fixture(scope="module")
+def planning_tasks():
+    """Tasks from create_test_tasks(), shared by the planning tests."""
+    return create_test_tasks()
+
+
+@pytest.fixture(scope="module")
+def normal_plan_request(normal_decision, planning_tasks):
+    """PlanRequest for planning_tasks under NORMAL authority."""
+    _, _, authority = normal_decision
+    return PlanRequest(tasks=planning_tasks, constraints=Constraint(), decision_state=authority)
+
+
+@pytest.fixture(scope="module")
+def overloaded_plan_request(overloaded_decision, planning_tasks):
+    """PlanRequest for planning_tasks under OVERLOADED authority."""
+    _, _, authority = overloaded_decision
+    return PlanRequest(tasks=planning_tasks, constraints=Constraint(), decision_state=authority)
+
+
 # ============================================================================
 # Dimension 1: Decision Core - 状态判定正确性
 # ============================================================================
@@ -134,63 +197,51 @@ class TestAuthority:
     Validates: Requirements 2.1, 2.2, 2.3, 2.4, 2.5
     """
     
-    def test_overloaded_denies_planning(self, overloaded_inputs, config):
+    def test_overloaded_denies_planning(self, overloaded_decision):
         """Test OVERLOADED state results in planning DENIED.
         
         Validates: Requirement 2.1
         """
-        state_result = evaluate_state(overloaded_inputs, config)
-        rule_result = get_active_rules(state_result.state, config)
-        authority = derive_authority(state_result, rule_result)
+        _, _, authority = overloaded_decision
         
         assert authority.planning == "DENIED"
         assert authority.state == "OVERLOADED"
     
-    def test_stressed_denies_planning(self, stressed_inputs, config):
+    def test_stressed_denies_planning(self, stressed_decision):
         """Test STRESSED state results in planning DENIED.
         
         Validates: Requirement 2.2
         """
-        state_result = evaluate_state(stressed_inputs, config)
-        rule_result = get_active_rules(state_result.state, config)
-        authority = derive_authority(state_result, rule_result)
+        _, _, authority = stressed_decision
         
         assert authority.planning == "DENIED"
         assert authority.state == "STRESSED"
     
-    def test_normal_allows_planning(self, normal_inputs, config):
+    def test_normal_allows_planning(self, normal_decision):
         """Test NORMAL state results in planning ALLOWED.
         
         Validates: Requirement 2.3
         """
-        state_result = evaluate_state(normal_inputs, config)
-        rule_result = get_active_rules(state_result.state, config)
-        authority = derive_authority(state_result, rule_result)
+        _, _, authority = normal_decision
         
         assert authority.planning == "ALLOWED"
         assert authority.state == "NORMAL"
     
-    def test_execution_always_denied(self, normal_inputs, stressed_inputs, 
-                                     overloaded_inputs, config):
+    @pytest.mark.parametrize("decision_fixture", DECISION_FIXTURES)
+    def test_execution_always_denied(self, request, decision_fixture):
         """Test execution permission is ALWAYS denied in all states.
         
         Validates: Requirement 2.4
         """
-        for inputs in [normal_inputs, stressed_inputs, overloaded_inputs]:
-            state_result = evaluate_state(inputs, config)
-            rule_result = get_active_rules(state_result.state, config)
-            authority = derive_authority(state_result, rule_result)
-            
-            assert authority.execution == "DENIED"
+        _, _, authority = request.getfixturevalue(decision_fixture)
+        assert authority.execution == "DENIED"
     
-    def test_authority_derived_from_decision_core(self, normal_inputs, config):
+    def test_authority_derived_from_decision_core(self, normal_decision):
         """Test all permissions are derived from Decision Core output.
         
         Validates: Requirement 2.5
         """
-        state_result = evaluate_state(normal_inputs, config)
-        rule_result = get_active_rules(state_result.state, config)
-        authority = derive_authority(state_result, rule_result)
+        state_result, rule_result, authority = normal_decision
         
         # Authority contains Decision Core state
         assert authority.state == state_result.state
@@ -208,81 +259,46 @@ class TestContainment:
     Validates: Requirements 3.1, 3.2, 3.3, 3.4
     """
     
-    def test_planning_refused_when_denied(self, overloaded_inputs, config):
+    def test_planning_refused_when_denied(self, overloaded_plan_request):
         """Test planning is refused when permission is DENIED.
         
         Validates: Requirement 3.1
         """
-        state_result = evaluate_state(overloaded_inputs, config)
-        rule_result = get_active_rules(state_result.state, config)
-        authority = derive_authority(state_result, rule_result)
-        
-        tasks = create_test_tasks()
-        request = PlanRequest(
-            tasks=tasks,
-            constraints=Constraint(),
-            decision_state=authority
-        )
-        
-        result = propose_plan(request)
+        result = propose_plan(overloaded_plan_request)
         
         # Planning should be blocked
         assert result.advisory is None
         assert "ADVICE BLOCKED" in result.reason
         assert result.blocked_by == "Decision Core"
     
-    def test_execution_always_refused(self, normal_inputs, config):
+    def test_execution_always_refused(self, normal_decision):
         """Test execution is ALWAYS refused regardless of state.
         
         Validates: Requirement 3.2
         """
-        state_result = evaluate_state(normal_inputs, config)
-        rule_result = get_active_rules(state_result.state, config)
-        authority = derive_authority(state_result, rule_result)
+        _, _, authority = normal_decision
         
         # Even in NORMAL state, execution should fail
         with pytest.raises(ExecutionError):
             execute_action({"action": "test"}, authority)
     
-    def test_refusal_provides_clear_reason(self, overloaded_inputs, config):
+    def test_refusal_provides_clear_reason(self, overloaded_plan_request):
         """Test refusal messages provide clear reasons.
         
         Validates: Requirement 3.3
         """
-        state_result = evaluate_state(overloaded_inputs, config)
-        rule_result = get_active_rules(state_result.state, config)
-        authority = derive_authority(state_result, rule_result)
-        
-        tasks = create_test_tasks()
-        request = PlanRequest(
-            tasks=tasks,
-            constraints=Constraint(),
-            decision_state=authority
-        )
-        
-        result = propose_plan(request)
+        result = propose_plan(overloaded_plan_request)
         
         # Refusal should have clear reason
         assert result.reason
         assert "Decision Core" in result.reason or "ADVICE BLOCKED" in result.reason
     
-    def test_refusal_references_decision_core(self, overloaded_inputs, config):
+    def test_refusal_references_decision_core(self, overloaded_plan_request):
         """Test refusal messages reference Decision Core judgment.
         
         Validates: Requirement 3.4
         """
-        state_result = evaluate_state(overloaded_inputs, config)
-        rule_result = get_active_rules(state_result.state, config)
-        authority = derive_authority(state_result, rule_result)
-        
-        tasks = create_test_tasks()
-        request = PlanRequest(
-            tasks=tasks,
-            constraints=Constraint(),
-            decision_state=authority
-        )
-        
-        result = propose_plan(request)
+        result = propose_plan(overloaded_plan_request)
         
         # Should reference Decision Core
         assert "Decision Core" in result.reason
@@ -298,86 +314,51 @@ class TestAdvisory:
     Validates: Requirements 4.1, 4.2, 4.3, 4.4
     """
     
-    def test_advisory_provides_advice_when_allowed(self, normal_inputs, config):
+    def test_advisory_provides_advice_when_allowed(self, normal_plan_request):
         """Test advisory provides advice when planning is ALLOWED.
         
         Validates: Requirement 4.1
         """
-        state_result = evaluate_state(normal_inputs, config)
-        rule_result = get_active_rules(state_result.state, config)
-        authority = derive_authority(state_result, rule_result)
-        
-        tasks = create_test_tasks()
-        request = PlanRequest(
-            tasks=tasks,
-            constraints=Constraint(),
-            decision_state=authority
-        )
-        
-        result = propose_plan(request)
+        result = propose_plan(normal_plan_request)
         
         # Should provide advisory output
         assert result.advisory is not None
         assert isinstance(result.advisory, AdvisoryOutput)
     
-    def test_advisory_blocked_when_denied(self, overloaded_inputs, config):
+    def test_advisory_blocked_when_denied(self, overloaded_plan_request):
         """Test advisory does NOT provide advice when planning is DENIED.
         
         Validates: Requirement 4.2
         """
-        state_result = evaluate_state(overloaded_inputs, config)
-        rule_result = get_active_rules(state_result.state, config)
-        authority = derive_authority(state_result, rule_result)
-        
-        tasks = create_test_tasks()
-        request = PlanRequest(
-            tasks=tasks,
-            constraints=Constraint(),
-            decision_state=authority
-        )
-        
-        result = propose_plan(request)
+        result = propose_plan(overloaded_plan_request)
         
         # Should NOT provide advisory output
         assert result.advisory is None
     
-    def test_advisory_uses_descriptive_language(self, normal_inputs, config):
+    def test_advisory_uses_descriptive_language(self, normal_plan_request):
         """Test advisory uses descriptive (not prescriptive) language.
         
         Validates: Requirement 4.3
         """
-        state_result = evaluate_state(normal_inputs, config)
-        rule_result = get_active_rules(state_result.state, config)
-        authority = derive_authority(state_result, rule_result)
-        
-        tasks = create_test_tasks()
-        request = PlanRequest(
-            tasks=tasks,
-            constraints=Constraint(),
-            decision_state=authority
-        )
-        
-        result = propose_plan(request)
+        result = propose_plan(normal_plan_request)
         
         # Advisory should exist
         assert result.advisory is not None
         
         # Check that recommendations don't use prescriptive language
         # (This is a basic check - full language analysis would be more complex)
-        all_text = " ".join(result.advisory.recommendations + 
-                           result.advisory.observations)
+        texts = [text.lower() for text in chain(result.advisory.recommendations,
+                                                result.advisory.observations)]
         
         # Should not contain scheduling language
-        assert "at" not in all_text.lower() or "treat" in all_text.lower()
+        assert not any("at" in text for text in texts) or any("treat" in text for text in texts)
     
-    def test_advisory_does_not_modify_input(self, normal_inputs, config):
+    def test_advisory_does_not_modify_input(self, normal_decision):
         """Test advisory does not modify input data.
         
         Validates: Requirement 4.4
         """
-        state_result = evaluate_state(normal_inputs, config)
-        rule_result = get_active_rules(state_result.state, config)
-        authority = derive_authority(state_result, rule_result)
+        _, _, authority = normal_decision
         
         tasks = create_test_tasks()
         original_task_count = len(tasks)
@@ -400,37 +381,36 @@ class TestAdvisory:
 # Dimension 5: Safety Boundary - 安全边界
 # ============================================================================
 
+@pytest.mark.parametrize("decision_fixture", DECISION_FIXTURES)
 class TestSafetyBoundary:
     """Test system can prove it will not exceed authority.
     
+    Every test runs once per state (NORMAL, STRESSED, OVERLOADED).
+    
     Validates: Requirements 5.1, 5.2, 5.3, 5.4, 5.5
     """
     
-    def test_execution_denied_in_all_states(self, normal_inputs, stressed_inputs,
-                                           overloaded_inputs, config):
+    @pytest.fixture
+    def decision(self, request, decision_fixture):
+        """Decision Core output for the state under test."""
+        return request.getfixturevalue(decision_fixture)
+    
+    def test_execution_denied_in_all_states(self, decision):
         """Test execution_permission is DENIED in all states.
         
         Validates: Requirement 5.1
         """
-        for inputs in [normal_inputs, stressed_inputs, overloaded_inputs]:
-            state_result = evaluate_state(inputs, config)
-            rule_result = get_active_rules(state_result.state, config)
-            authority = derive_authority(state_result, rule_result)
-            
-            assert authority.execution == "DENIED"
+        _, _, authority = decision
+        assert authority.execution == "DENIED"
     
-    def test_advisory_never_calls_execution(self, normal_inputs, config):
+    def test_advisory_never_calls_execution(self, decision, planning_tasks):
         """Test Advisory Layer never calls Execution Layer.
         
         Validates: Requirement 5.2
         """
-        state_result = evaluate_state(normal_inputs, config)
-        rule_result = get_active_rules(state_result.state, config)
-        authority = derive_authority(state_result, rule_result)
-        
-        tasks = create_test_tasks()
+        _, _, authority = decision
         request = PlanRequest(
-            tasks=tasks,
+            tasks=planning_tasks,
             constraints=Constraint(),
             decision_state=authority
         )
@@ -442,88 +422,49 @@ class TestSafetyBoundary:
         # The fact that we get here proves advisory didn't call execution
         assert result is not None
     
-    def test_all_permissions_from_decision_core(self, normal_inputs, config):
+    def test_all_permissions_from_decision_core(self, decision):
         """Test all permissions are derived from Decision Core.
         
         Validates: Requirement 5.3
         """
-        state_result = evaluate_state(normal_inputs, config)
-        rule_result = get_active_rules(state_result.state, config)
-        authority = derive_authority(state_result, rule_result)
+        state_result, _, authority = decision
         
         # Authority must contain Decision Core state
-        assert authority.state in ["NORMAL", "STRESSED", "OVERLOADED"]
+        assert authority.state in VALID_STATES
         assert authority.state == state_result.state
     
-    def test_no_layer_bypasses_authority(self, normal_inputs, config):
+    def test_no_layer_bypasses_authority(self, decision, planning_tasks):
         """Test no layer can bypass Authority System.
         
         Validates: Requirement 5.4
         """
         # Planning layer requires authority
-        tasks = create_test_tasks()
-        
         # Cannot create PlanRequest without authority
         # (This is enforced by type system - authority is required parameter)
-        state_result = evaluate_state(normal_inputs, config)
-        rule_result = get_active_rules(state_result.state, config)
-        authority = derive_authority(state_result, rule_result)
+        _, _, authority = decision
         
         request = PlanRequest(
-            tasks=tasks,
+            tasks=planning_tasks,
             constraints=Constraint(),
             decision_state=authority  # Required - cannot bypass
         )
         
         assert request.decision_state == authority
     
-    def test_execution_layer_call_fails_immediately(self, normal_inputs, config):
+    def test_execution_layer_call_fails_immediately(self, decision):
         """Test calling Execution Layer fails immediately with ExecutionError.
         
         Validates: Requirement 5.5
         """
-        state_result = evaluate_state(normal_inputs, config)
-        rule_result = get_active_rules(state_result.state, config)
-        authority = derive_authority(state_result, rule_result)
+        _, _, authority = decision
         
-        # Any attempt to execute should fail immediately
-        with pytest.raises(ExecutionError) as exc_info:
+        # Any attempt to execute should fail immediately, with a clear message
+        with pytest.raises(ExecutionError, match=re.escape(DISABLED_MESSAGE)):
             execute_action({"action": "test"}, authority)
-        
-        # Error message should be clear
-        assert "Automation disabled" in str(exc_info.value)
-
-
-# ============================================================================
-# Test Report Generation
-# ============================================================================
-
-def print_dimension_results():
-    """Print test results by dimension.
-    
-    Validates: Requirements 6.1, 6.2, 6.3, 6.4, 6.5
-    """
-    print("\n" + "="*70)
-    print("v0.3 VALIDATION TEST RESULTS")
-    print("="*70)
-    
-    dimensions = [
-        "Dimension 1: Decision Core",
-        "Dimension 2: Authority",
-        "Dimension 3: Containment",
-        "Dimension 4: L1 Advisory",
-        "Dimension 5: Safety Boundary"
-    ]
-    
-    for dim in dimensions:
-        print(f"\n{dim}: PASS")
-    
-    print("\n" + "="*70)
-    print("OVERALL: ALL DIMENSIONS PASSED")
-    print("="*70 + "\n")
 
 
 if __name__ == "__main__":
-    # Run tests with pytest
-    pytest.main([__file__, "-v"])
-    print_dimension_results()
+    # Run tests with pytest; per-dimension results are the per-class lines in
+    # the verbose report (`python -m pl_dss.plo_cli validate-v03` also prints
+    # a dimension summary when everything passes)
+    sys.exit(pytest.main([__file__, "-v"]))
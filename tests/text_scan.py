@@ -0,0 +1,29 @@
+"""Shared text-scanning helpers for the PL-DSS test suite."""
+
+import re
+from typing import Iterable, Set
+
+
+def find_patterns(text: str, patterns: Iterable[str]) -> Set[str]:
+    """Find which of the given literal patterns occur in text, in a single pass.
+    
+    Args:
+        text: Text to scan
+        patterns: Literal substrings to look for
+        
+    Returns:
+        Set of patterns that occur at least once in text
+    """
+    patterns = set(patterns)
+    if not patterns:
+        # An empty alternation would match at every position
+        return set()
+    
+    # Zero-width lookahead so overlapping occurrences are all reported; longest
+    # alternatives first so each position reports the longest pattern there
+    alternation = "|".join(re.escape(p) for p in sorted(patterns, key=len, reverse=True))
+    found = {match.group(1) for match in re.finditer(f"(?=({alternation}))", text)}
+    
+    # A pattern that only occurs as a prefix of a longer match is shadowed at
+    # that position, but is still present
+    return found | {p for p in patterns if any(f.startswith(p) for f in found)}